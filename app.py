@@ -5,6 +5,17 @@ import json
 
 API_URL = "http://localhost:8000"
 
+# Default (connect, read) timeouts for backend calls
+REQUEST_TIMEOUT = (2, 10)
+
+@st.cache_resource
+def get_session():
+    """Shared requests.Session so backend calls reuse pooled keep-alive connections."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    return session
+
 st.set_page_config(
     page_title="Agentic Physics Assistant",
     page_icon="🤖",
@@ -15,15 +26,36 @@ st.set_page_config(
 st.title("🤖 Agentic Physics Assistant")
 st.markdown("A fully agentic, LLM-powered physics problem solver with memory, reflection, and learning.")
 
+# Cached backend fetches: Streamlit reruns the whole script on every widget
+# interaction, so without a TTL cache each keystroke would hit the backend.
+@st.cache_data(ttl=10)
+def fetch_health():
+    resp = get_session().get(f"{API_URL}/health", timeout=REQUEST_TIMEOUT)
+    return resp.json() if resp.ok else None
+
+@st.cache_data(ttl=30)
+def fetch_memory(limit):
+    return get_session().get(f"{API_URL}/agent_memory?limit={limit}", timeout=REQUEST_TIMEOUT).json()
+
+@st.cache_data(ttl=60)
+def fetch_knowledge(concept):
+    return get_session().get(f"{API_URL}/knowledge/{concept}", timeout=REQUEST_TIMEOUT).json()
+
 # Sidebar: Agent Status and Memory
 def show_agent_status():
+    # Keep fetched results in session_state so reruns (every widget
+    # interaction reruns the script) re-render them without new downloads.
+    ss = st.session_state
+
     st.sidebar.header("Agent Status")
     try:
-        resp = requests.get(f"{API_URL}/health")
-        if resp.ok:
-            status = resp.json()
+        now = time.monotonic()
+        if now - ss.get("health_ts", 0) > 5:
+            ss.health = fetch_health()
+            ss.health_ts = now
+        if ss.health is not None:
             st.sidebar.success("Agent is healthy!")
-            st.sidebar.write(f"**Time:** {status['timestamp']}")
+            st.sidebar.write(f"**Time:** {ss.health['timestamp']}")
         else:
             st.sidebar.error("Agent not available.")
     except Exception:
@@ -32,19 +64,21 @@ def show_agent_status():
     st.sidebar.header("Agent Memory")
     if st.sidebar.button("Show Recent Memory"):
         try:
-            mem = requests.get(f"{API_URL}/agent_memory?limit=5").json()
-            for exp in mem.get("experiences", []):
-                st.sidebar.write(f"- {exp['problem_text'][:60]}...")
+            ss.memory = fetch_memory(5)
         except Exception:
             st.sidebar.warning("Could not fetch memory.")
+    if "memory" in ss:
+        for exp in ss.memory.get("experiences", []):
+            st.sidebar.write(f"- {exp['problem_text'][:60]}...")
 
     st.sidebar.header("Agent Knowledge")
     if st.sidebar.button("Show Knowledge (Pendulum)"):
         try:
-            know = requests.get(f"{API_URL}/knowledge/pendulum").json()
-            st.sidebar.write(know.get("knowledge", {}))
+            ss.knowledge_pendulum = fetch_knowledge("pendulum")
         except Exception:
             st.sidebar.warning("Could not fetch knowledge.")
+    if "knowledge_pendulum" in ss:
+        st.sidebar.write(ss.knowledge_pendulum.get("knowledge", {}))
 
 show_agent_status()
 
@@ -58,22 +92,38 @@ problem_text = st.text_area(
 
 col1, col2 = st.columns([1, 1])
 
-with col1:
+# Fragment: only this block reruns while a solve is in flight, so the
+# sidebar status/memory/knowledge fetches don't re-execute per poll.
+@st.fragment
+def solve_block():
     if st.button("🚀 Solve Problem", type="primary"):
         if not problem_text.strip():
             st.warning("Please enter a problem.")
         else:
             with st.spinner("Submitting to agent..."):
-                resp = requests.post(f"{API_URL}/solve_problem", json={"problem_text": problem_text})
+                resp = get_session().post(f"{API_URL}/solve_problem", json={"problem_text": problem_text}, timeout=REQUEST_TIMEOUT)
                 if not resp.ok:
                     st.error("Agent backend error.")
                 else:
                     task_id = resp.json()["task_id"]
                     st.info(f"Task ID: {task_id}")
-                    # Poll for result
-                    for _ in range(60):
-                        time.sleep(1)
-                        status = requests.get(f"{API_URL}/task_status/{task_id}").json()
+                    # Long-poll: a backend that implements `wait` holds each
+                    # request open until the task completes or `wait` expires,
+                    # so the UI sees the result within one round-trip. Servers
+                    # that ignore the parameter answer immediately, so any
+                    # early return still backs off before the next poll
+                    # instead of spinning on the socket.
+                    progress = st.empty()
+                    deadline = time.monotonic() + 120
+                    completed = False
+                    last_state = None
+                    delay = 0.1
+                    while time.monotonic() < deadline:
+                        poll_started = time.monotonic()
+                        status = get_session().get(
+                            f"{API_URL}/task_status/{task_id}?wait=50",
+                            timeout=(2, 55)
+                        ).json()
                         if status["status"] == "completed":
                             result = status["result"]
                             st.success("**Agent Answer:**")
@@ -81,18 +131,26 @@ with col1:
                             # Reflection (if available)
                             if "reflection" in result:
                                 st.info(f"**Agent Reflection:** {result['reflection']}")
+                            completed = True
                             break
-                        else:
-                            st.write("Waiting for agent...")
-                    else:
+                        elif status["status"] != last_state:
+                            last_state = status["status"]
+                            progress.write("Waiting for agent...")
+                        if time.monotonic() - poll_started < 1.0:
+                            time.sleep(delay)
+                            delay = min(delay * 1.5, 5.0)
+                    if not completed:
                         st.warning("Timeout waiting for agent result.")
 
+with col1:
+    solve_block()
+
 with col2:
     st.markdown("### 🎯 Set Agent Goal")
     goal = st.text_input("Set a new goal for the agent:", "Master projectile motion problems")
     if st.button("Set Goal"):
         try:
-            resp = requests.post(f"{API_URL}/set_goal", params={"goal_description": goal})
+            resp = get_session().post(f"{API_URL}/set_goal", params={"goal_description": goal}, timeout=REQUEST_TIMEOUT)
             if resp.ok:
                 st.success("Goal set!")
             else:
@@ -104,7 +162,7 @@ with col2:
     concept = st.text_input("Physics concept (e.g. pendulum, projectile_motion):", "projectile_motion")
     if st.button("Lookup Knowledge"):
         try:
-            know = requests.get(f"{API_URL}/knowledge/{concept}").json()
+            know = fetch_knowledge(concept)
             st.write(know.get("knowledge", {}))
         except Exception:
             st.warning("Could not fetch knowledge.")
@@ -1,5 +1,5 @@
 # agents/__init__.py
-from .agentic_agent import PhysicsAgent
+from .agentic_agent import PhysicsAgent, get_agent
 from .agentic_memory import AgenticMemory
 
-__all__ = ['PhysicsAgent', 'AgenticMemory']
+__all__ = ['PhysicsAgent', 'get_agent', 'AgenticMemory']
@@ -1,46 +1,40 @@
 """
 LangChain-based Agentic Physics Agent (Advanced)
 """
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 from langchain.agents import initialize_agent, AgentType
 from langchain_openai import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationTokenBufferMemory
 from agents.agentic_tools import solve_physics_problem, get_physics_knowledge, reflect_on_solution, web_search, set_agent_goal, verify_solution_with_simulation
 from agents.agentic_memory import AgenticMemory
 from config.settings import Config
 
-class PhysicsAgent:
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model=Config.LLM_MODEL,
-            temperature=Config.LLM_TEMPERATURE,
-            api_key=Config.OPENAI_API_KEY
-        )
-        self.memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
-        self.tools = [
-            solve_physics_problem,
-            get_physics_knowledge,
-            reflect_on_solution,
-            web_search,
-            set_agent_goal,
-            verify_solution_with_simulation
-        ]
-        self.agent_executor = initialize_agent(
-            tools=self.tools,
-            llm=self.llm,
-            agent=AgentType.OPENAI_FUNCTIONS,
-            memory=self.memory,
-            verbose=True,
-            max_iterations=10,
-            handle_parsing_errors=True,
-        )
-        self.db = AgenticMemory()
+# Connectives that mark a multi-part problem; compiled once and shared by
+# the complexity check and the split itself.
+_SUBPROBLEM_SPLIT_RE = re.compile(r'\b(?:and|then|after|while|simultaneously)\b', re.IGNORECASE)
 
-    def run_agentic_pipeline(self, problem_text: str) -> dict:
-        """
-        Runs the full, end-to-end agentic pipeline with self-correction.
-        """
-        try:
-            prompt = f"""
+_INSTANCE = None
+
+def get_agent() -> "PhysicsAgent":
+    """Return the shared PhysicsAgent, constructing it on first use.
+
+    Building an agent wires up the LLM client, tools, and memory; callers
+    should reuse one instance per process rather than paying that setup
+    (and a fresh TLS connection) per request.
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = PhysicsAgent()
+    return _INSTANCE
+
+# Static pipeline instructions, hoisted to module scope. Keeping the
+# invariant prefix first (and byte-identical across calls) lets OpenAI's
+# automatic prompt caching reuse it instead of re-processing ~1.5KB of
+# instructions per request.
+_PIPELINE_PROMPT_PREFIX = """
             You are a highly intelligent, flexible physics expert agent and educator. Your goal is to solve ANY physics problem accurately AND provide a comprehensive, educational explanation that teaches the user the underlying physics concepts.
 
             IMPORTANT: Be flexible and intelligent. Don't rely on exact templates or rigid patterns. Understand the physics concepts regardless of how they're described.
@@ -113,11 +107,64 @@ class PhysicsAgent:
 
             Remember: Your goal is not just to give the answer, but to TEACH the physics concepts and reasoning process.
 
-            Begin solving this physics problem: "{problem_text}"
-            """
-            
-            final_response = self.agent_executor.run(prompt)
-            
+"""
+
+class PhysicsAgent:
+    def __init__(self, learning_memory=None):
+        # Injected so callers (e.g. Streamlit via st.cache_resource) can share
+        # one LearningMemory — and its SQLite connection — across reruns
+        self.learning_memory = learning_memory
+        self.llm = ChatOpenAI(
+            model=Config.LLM_MODEL,
+            temperature=Config.LLM_TEMPERATURE,
+            api_key=Config.OPENAI_API_KEY,
+            streaming=True,
+            # Keep-alive HTTP/2 client: every LLM call after the first reuses
+            # the TLS connection to api.openai.com instead of re-handshaking
+            http_client=httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=16)
+            )
+        )
+        # Token-bounded history: the full buffer was resent with every call,
+        # so per-turn prompt size (and latency/cost) grew with session length
+        self.memory = ConversationTokenBufferMemory(
+            llm=self.llm,
+            max_token_limit=2000,
+            memory_key="chat_history",
+            return_messages=True
+        )
+        self.tools = [
+            solve_physics_problem,
+            get_physics_knowledge,
+            reflect_on_solution,
+            web_search,
+            set_agent_goal,
+            verify_solution_with_simulation
+        ]
+        self.agent_executor = initialize_agent(
+            tools=self.tools,
+            llm=self.llm,
+            agent=AgentType.OPENAI_FUNCTIONS,
+            memory=self.memory,
+            verbose=True,
+            max_iterations=10,
+            handle_parsing_errors=True,
+        )
+        self.db = AgenticMemory()
+
+    def _pipeline_prompt(self, problem_text: str) -> str:
+        """Build the self-correcting pipeline prompt for a problem."""
+        return _PIPELINE_PROMPT_PREFIX + f'\n            Begin solving this physics problem: "{problem_text}"\n            '
+
+    def run_agentic_pipeline(self, problem_text: str) -> dict:
+        """
+        Runs the full, end-to-end agentic pipeline with self-correction.
+        """
+        try:
+            prompt = self._pipeline_prompt(problem_text)
+            final_response = asyncio.run(self._solve_with_prefetch(prompt, problem_text))
+
             self.db.add_experience(problem_text, final_response, True, {"type": "self_correcting_pipeline"})
             
             return {
@@ -131,6 +178,36 @@ class PhysicsAgent:
                 "success": False
             }
 
+    def stream_agentic_pipeline(self, problem_text: str):
+        """Yield the agent's response incrementally as the LLM generates it.
+
+        Lets the UI render tokens as they arrive (st.write_stream) instead of
+        blocking until the full generation completes; the experience is
+        recorded once the stream is exhausted.
+        """
+        prompt = self._pipeline_prompt(problem_text)
+        pieces = []
+        for chunk in self.agent_executor.stream({"input": prompt}):
+            output = chunk.get("output")
+            if output:
+                pieces.append(output)
+                yield output
+        self.db.add_experience(problem_text, "".join(pieces), True,
+                               {"type": "self_correcting_pipeline"})
+
+    async def _solve_with_prefetch(self, prompt: str, problem_text: str) -> str:
+        """Run the agent while prefetching related experiences concurrently.
+
+        The memory lookup warms AgenticMemory's query cache in parallel with
+        the (much longer) LLM run, so any reflection/learning step that asks
+        for similar experiences afterwards is a cache hit instead of a fresh
+        embedding + kNN query on the critical path.
+        """
+        solve_task = self.agent_executor.arun(prompt)
+        prefetch_task = asyncio.to_thread(self.db.get_similar_experiences, problem_text, 3)
+        final_response, _ = await asyncio.gather(solve_task, prefetch_task)
+        return final_response
+
     def solve_problem_autonomously(self, problem_text: str) -> dict:
         """Solve problem using agentic system with autonomous decision making"""
         try:
@@ -211,13 +288,11 @@ class PhysicsAgent:
     def get_agent_status(self) -> dict:
         """Get current agent status"""
         try:
-            # Get memory statistics
-            experiences = self.db.get_similar_experiences("", limit=1000)  # Get all
-            knowledge_items = self.db.search_knowledge("", limit=1000)  # Get all
-            
+            # Get memory statistics via O(1) collection counts instead of
+            # pulling every document through the embedding/query path
             return {
-                "total_experiences": len(experiences),
-                "total_knowledge": len(knowledge_items),
+                "total_experiences": self.db.count_experiences(),
+                "total_knowledge": self.db.count_knowledge(),
                 "total_strategies": 5,  # Hardcoded for now
                 "active_goals": 1,  # Hardcoded for now
                 "capabilities": [
@@ -242,13 +317,24 @@ class PhysicsAgent:
 
     def solve_problem(self, problem_text: str) -> dict:
         # If the problem is complex, break it down
-        if any(word in problem_text.lower() for word in ["and", "then", "after", "while", "simultaneously"]):
+        if _SUBPROBLEM_SPLIT_RE.search(problem_text):
             subproblems = self._split_into_subproblems(problem_text)
-            responses = []
-            for sub in subproblems:
-                resp = self.agent_executor.run(f"Solve this physics problem: {sub}")
-                self.db.add_experience(sub, resp, True, {"type": "solve"})
-                responses.append(resp)
+            if not subproblems:
+                # Inputs that are all connectives ("and then") split to
+                # nothing; solve the original text as one problem rather
+                # than handing the executor zero workers
+                subproblems = [problem_text]
+            # LLM calls are IO-bound, so run the subproblems concurrently:
+            # total latency becomes max(subproblem) instead of sum(subproblems)
+            with ThreadPoolExecutor(max_workers=min(8, len(subproblems))) as executor:
+                responses = list(executor.map(
+                    lambda sub: self.agent_executor.run(f"Solve this physics problem: {sub}"),
+                    subproblems
+                ))
+            self.db.add_experiences([
+                (sub, resp, True, {"type": "solve"})
+                for sub, resp in zip(subproblems, responses)
+            ])
             return {"response": responses, "note": "Solved as multiple subproblems."}
         else:
             response = self.agent_executor.run(f"Solve this physics problem: {problem_text}")
@@ -272,5 +358,6 @@ class PhysicsAgent:
 
     def _split_into_subproblems(self, problem_text: str):
         # Naive split: split on 'and', 'then', etc.
-        import re
-        return [s.strip() for s in re.split(r'and|then|after|while|simultaneously', problem_text) if s.strip()] 
\ No newline at end of file
+        if not _SUBPROBLEM_SPLIT_RE.search(problem_text):
+            return [problem_text]
+        return [s.strip() for s in _SUBPROBLEM_SPLIT_RE.split(problem_text) if s.strip()] 
\ No newline at end of file
@@ -2,29 +2,88 @@
 ChromaDB-based Memory for Agentic Physics System
 """
 import chromadb
+from chromadb.utils import embedding_functions
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+import itertools
 import os
 import json
+import threading
+import time
+
+# Process-wide monotonic suffix for experience IDs: cheaper than a wallclock
+# read per row and collision-free for inserts landing on the same timestamp.
+_ID_COUNTER = itertools.count()
+
+# Chroma's default embedding model (all-MiniLM-L6-v2), instantiated once and
+# fronted by an LRU cache so recurring query strings cost a dict lookup
+# instead of an embedding-model forward pass.
+_embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+
+@lru_cache(maxsize=1024)
+def _embed(text: str) -> Tuple[float, ...]:
+    return tuple(_embedding_fn([text])[0])
+
+# One PersistentClient per path, shared across AgenticMemory instances:
+# every client construction reopens the on-disk store and its SQLite handles.
+_client_cache: Dict[str, Any] = {}
+_client_lock = threading.Lock()
 
 class AgenticMemory:
     def __init__(self, memory_path: str = "data/agentic_memory"):
         self.memory_path = memory_path
         os.makedirs(memory_path, exist_ok=True)
-        self.client = chromadb.PersistentClient(path=memory_path)
+        with _client_lock:
+            if memory_path not in _client_cache:
+                _client_cache[memory_path] = chromadb.PersistentClient(path=memory_path)
+            self.client = _client_cache[memory_path]
         self.experiences = self.client.get_or_create_collection("experiences")
         self.knowledge = self.client.get_or_create_collection("knowledge")
+        # Query-result memo: recurring query strings skip the embedding model.
+        # The version counters invalidate cached results on every write;
+        # FIFO-bounded so entries orphaned by version bumps can't
+        # accumulate for the life of the process.
+        self._query_cache: Dict[Any, List[Dict[str, Any]]] = {}
+        self._query_cache_max = 256
+        self._experiences_version = 0
+        self._knowledge_version = 0
+
+    def _cache_store(self, key: Any, value: List[Dict[str, Any]]):
+        if len(self._query_cache) >= self._query_cache_max:
+            self._query_cache.pop(next(iter(self._query_cache)))
+        self._query_cache[key] = value
 
     def add_experience(self, problem_text: str, solution: str, success: bool, metadata: Dict[str, Any]):
         self.experiences.add(
             documents=[problem_text],
             metadatas=[{"solution": solution, "success": success, **metadata}],
-            ids=[f"exp_{datetime.now().timestamp()}"]
+            ids=[f"exp_{time.time_ns()}_{next(_ID_COUNTER)}"]
+        )
+        self._experiences_version += 1
+
+    def add_experiences(self, rows: List[Tuple[str, str, bool, Dict[str, Any]]]):
+        """Add many experiences in one call.
+
+        A single list-based .add() runs one embedding batch and one index
+        update instead of one of each per experience.
+        """
+        if not rows:
+            return
+        batch_ts = time.time_ns()
+        self.experiences.add(
+            documents=[row[0] for row in rows],
+            metadatas=[{"solution": row[1], "success": row[2], **row[3]} for row in rows],
+            ids=[f"exp_{batch_ts}_{next(_ID_COUNTER)}" for _ in rows]
         )
+        self._experiences_version += 1
 
     def get_similar_experiences(self, problem_text: str, limit: int = 5) -> List[Dict[str, Any]]:
-        results = self.experiences.query(query_texts=[problem_text], n_results=limit)
-        return [
+        cache_key = ("experiences", self._experiences_version, problem_text, limit)
+        if cache_key in self._query_cache:
+            return self._query_cache[cache_key]
+        results = self.experiences.query(query_embeddings=[list(_embed(problem_text))], n_results=limit)
+        experiences = [
             {
                 "problem_text": results['documents'][0][i],
                 "metadata": results['metadatas'][0][i],
@@ -32,6 +91,14 @@ class AgenticMemory:
             }
             for i in range(len(results['ids'][0]))
         ]
+        self._cache_store(cache_key, experiences)
+        return experiences
+
+    def count_experiences(self) -> int:
+        return self.experiences.count()
+
+    def count_knowledge(self) -> int:
+        return self.knowledge.count()
 
     def add_knowledge(self, concept: str, description: str, formulas: List[str], examples: List[str]):
         self.knowledge.add(
@@ -39,6 +106,7 @@ class AgenticMemory:
             metadatas=[{"description": description, "formulas": formulas, "examples": examples}],
             ids=[f"knowledge_{concept}"]
         )
+        self._knowledge_version += 1
 
     def get_knowledge(self, concept: str) -> Optional[Dict[str, Any]]:
         results = self.knowledge.get(where={"concept": concept})
@@ -53,8 +121,11 @@ class AgenticMemory:
         return None
 
     def search_knowledge(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        results = self.knowledge.query(query_texts=[query], n_results=limit)
-        return [
+        cache_key = ("knowledge", self._knowledge_version, query, limit)
+        if cache_key in self._query_cache:
+            return self._query_cache[cache_key]
+        results = self.knowledge.query(query_embeddings=[list(_embed(query))], n_results=limit)
+        knowledge_items = [
             {
                 "concept": results['documents'][0][i],
                 "description": results['metadatas'][0][i]["description"],
@@ -62,4 +133,6 @@ class AgenticMemory:
                 "examples": results['metadatas'][0][i]["examples"]
             }
             for i in range(len(results['ids'][0]))
-        ] 
\ No newline at end of file
+        ]
+        self._cache_store(cache_key, knowledge_items)
+        return knowledge_items 
\ No newline at end of file
@@ -7,22 +7,56 @@ from core.physics_solver import PhysicsSolver
 from core.verification import VerificationEngine
 from agents.agentic_memory import AgenticMemory
 from utils.data_models import Solution
-import requests
+import hashlib
+import re
+import httpx
+
+# Shared instances: tool functions are invoked once per LLM tool call, and
+# rebuilding the parser/solver/verifier (and reopening the ChromaDB client)
+# each time is pure overhead.
+_PARSER = ProblemParser()
+_SOLVER = PhysicsSolver()
+_VERIFIER = VerificationEngine()
+_MEMORY = AgenticMemory()
+
+# Result caches keyed on normalized problem text: retries and the agent's
+# self-correction loop resubmit equivalent problems, which would otherwise
+# re-run the full parse/solve (and simulation) path each time.
+_SOLVE_CACHE = {}
+_VERIFY_CACHE = {}
+
+# Keep-alive HTTP/2 client shared across web_search calls: reuses one
+# connection to the DuckDuckGo API instead of a full handshake per query.
+_HTTP = httpx.Client(
+    http2=True,
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=8)
+)
+
+# Captures either a bracketed list of values or a single scalar, with an
+# optional trailing unit, from strings like "Answer: [2.5, 0.0] m/s".
+_ANSWER_RE = re.compile(r'(?:Answer:\s*)?(?:\[([^\]]+)\]|([-+]?[0-9.]+(?:[eE][-+]?\d+)?))\s*(\S+)?')
+
+def _problem_key(*parts: str) -> str:
+    normalized = " ".join(re.sub(r"\s+", " ", part.strip().lower()) for part in parts)
+    return hashlib.blake2b(normalized.encode()).hexdigest()
 
 @tool
 def solve_physics_problem(problem_text: str) -> str:
     """Solve a physics problem using analytical methods."""
-    parser = ProblemParser()
-    solver = PhysicsSolver()
-    parsed = parser.parse_text_problem(problem_text)
-    solution = solver.solve_problem(parsed)
-    return f"Answer: {solution.answer} {solution.unit}\nMethod: {solution.method}\nSteps: {'; '.join(solution.steps)}"
+    key = _problem_key(problem_text)
+    if key in _SOLVE_CACHE:
+        return _SOLVE_CACHE[key]
+    parsed = _PARSER.parse_text_problem(problem_text)
+    solution = _SOLVER.solve_problem(parsed)
+    result = f"Answer: {solution.answer} {solution.unit}\nMethod: {solution.method}\nSteps: {'; '.join(solution.steps)}"
+    _SOLVE_CACHE[key] = result
+    return result
 
 @tool
 def get_physics_knowledge(concept: str) -> str:
     """Retrieve knowledge about a physics concept from memory."""
-    memory = AgenticMemory()
-    knowledge = memory.get_knowledge(concept)
+    knowledge = _MEMORY.get_knowledge(concept)
     if knowledge:
         return f"Concept: {knowledge['concept']}\nDescription: {knowledge['description']}\nFormulas: {', '.join(knowledge['formulas'])}\nExamples: {', '.join(knowledge['examples'])}"
     else:
@@ -36,33 +70,29 @@ def verify_solution_with_simulation(problem_text: str, analytical_solution: str)
     Returns a structured report indicating success or failure and includes a confidence score.
     """
     try:
-        parser = ProblemParser()
-        problem = parser.parse_text_problem(problem_text)
+        key = _problem_key(problem_text, analytical_solution)
+        if key in _VERIFY_CACHE:
+            return _VERIFY_CACHE[key]
+
+        problem = _PARSER.parse_text_problem(problem_text)
 
         # Robustly extract the numerical answer from the solution string
-        answer_str = analytical_solution
-        if "Answer:" in answer_str:
-            answer_str = answer_str.split("Answer:")[1].strip()
-
-        unit = ""
-        if '[' in answer_str:
-            # Handles list-based answers like in collision problems
-            answer_val = [float(x) for x in answer_str.split('[')[1].split(']')[0].split(',')]
-            unit_part = answer_str.split(']')[1]
-            if unit_part:
-                unit = unit_part.strip()
+        # in a single scan: bracketed lists (collisions) or scalar + unit
+        match = _ANSWER_RE.search(analytical_solution)
+        if not match:
+            raise ValueError(f"Could not find an answer in: {analytical_solution}")
+
+        if match.group(1):
+            answer_val = [float(x) for x in match.group(1).split(',')]
         else:
-            # Handles single numerical answers
-            parts = answer_str.split()
-            answer_val = float(parts[0])
-            if len(parts) > 1:
-                unit = parts[1]
+            answer_val = float(match.group(2))
+        unit = match.group(3) or ""
+        answer_str = match.group(0).strip()
 
         # Create a temporary Solution object for verification, now with the unit
         solution = Solution(answer=answer_val, method="analytical", unit=unit, steps=[])
 
-        verifier = VerificationEngine()
-        verification_result = verifier.verify_solution(problem, solution)
+        verification_result = _VERIFIER.verify_solution(problem, solution)
 
         if verification_result.is_valid:
             status = "SUCCESS: The analytical solution matches the simulation."
@@ -75,6 +105,7 @@ def verify_solution_with_simulation(problem_text: str, analytical_solution: str)
             f"Analytical Answer Provided: {answer_str}\\n"
             f"Simulation Result: {verification_result.simulation_result}"
         )
+        _VERIFY_CACHE[key] = report
         return report
     except Exception as e:
         return f"Verification Status: ERROR. Failed to run verification due to an error: {str(e)}"
@@ -89,8 +120,11 @@ def reflect_on_solution(problem_text: str, solution: str, success: bool) -> str:
 def web_search(query: str) -> str:
     """Search the web for physics facts using DuckDuckGo Instant Answer API."""
     try:
-        resp = requests.get(f"https://api.duckduckgo.com/?q={query}&format=json&no_redirect=1&no_html=1")
-        if resp.ok:
+        resp = _HTTP.get(
+            "https://api.duckduckgo.com/",
+            params={"q": query, "format": "json", "no_redirect": "1", "no_html": "1"}
+        )
+        if resp.is_success:
             data = resp.json()
             if data.get("AbstractText"):
                 return data["AbstractText"]
@@ -108,9 +142,8 @@ def web_search(query: str) -> str:
 @tool
 def set_agent_goal(goal: str) -> str:
     """Set a new autonomous goal for the agent."""
-    memory = AgenticMemory()
     from datetime import datetime, timedelta
     goal_id = f"goal_{datetime.now().timestamp()}"
     target_date = (datetime.now() + timedelta(days=7)).isoformat()
-    memory.add_knowledge(goal_id, goal, [], [f"autonomous goal, target: {target_date}"])
+    _MEMORY.add_knowledge(goal_id, goal, [], [f"autonomous goal, target: {target_date}"])
     return f"Goal set: {goal}" 
\ No newline at end of file
@@ -1,17 +1,9 @@
 # app.py
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import numpy as np
-from PIL import Image
-import pandas as pd
-import requests
-import json
 
 # Import new agentic system
-from agents.agentic_agent import PhysicsAgent
-from utils.data_models import PhysicsProblem, Solution, VerificationResult, ProblemType
-from config.settings import Config
+from agents.agentic_agent import PhysicsAgent, get_agent
+from core.learning_memory import LearningMemory
 
 # Configure Streamlit page
 st.set_page_config(
@@ -21,11 +13,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Shared learning memory: the SQLite connection and in-memory pattern dicts
+# survive Streamlit reruns instead of being rebuilt per interaction
+@st.cache_resource
+def get_memory():
+    return LearningMemory()
+
 # Initialize agentic system
 @st.cache_resource
 def initialize_agentic_system():
     """Initialize the agentic system"""
-    agent = PhysicsAgent()
+    agent = get_agent()
+    agent.learning_memory = get_memory()
     return agent
 
 def solve_problem_agentic(problem_text, agent):
@@ -37,28 +36,36 @@ def solve_problem_agentic(problem_text, agent):
         st.error(f"Error in agentic system: {str(e)}")
         return None
 
+# Fragment: the sidebar status reruns on its own (e.g. via the refresh
+# button) without re-executing the main solver area, and main-area button
+# clicks no longer re-query the agent's collections for these metrics.
+# Bare st.* calls only — fragments may not write into externally-created
+# containers like st.sidebar, so main() calls this inside `with
+# st.sidebar:` (the same pattern solve_block uses inside col1)
+@st.fragment
 def display_agentic_status(agent):
-    """Display the agentic system status in sidebar"""
+    """Display the agentic system status (rendered into the sidebar)"""
     status = agent.get_agent_status()
-    
-    st.sidebar.markdown("## 🤖 Agentic Status")
+
+    st.markdown("## 🤖 Agentic Status")
+    st.button("🔄 Refresh Status")
     
     # Compact status display
-    st.sidebar.metric("Experiences", status['total_experiences'])
-    st.sidebar.metric("Knowledge", status['total_knowledge'])
-    st.sidebar.metric("Strategies", status['total_strategies'])
-    st.sidebar.metric("Active Goals", status['active_goals'])
+    st.metric("Experiences", status['total_experiences'])
+    st.metric("Knowledge", status['total_knowledge'])
+    st.metric("Strategies", status['total_strategies'])
+    st.metric("Active Goals", status['active_goals'])
     
     # Agent capabilities
-    st.sidebar.markdown("### 🧠 Capabilities")
+    st.markdown("### 🧠 Capabilities")
     for capability in status['capabilities']:
-        st.sidebar.caption(f"• {capability.replace('_', ' ').title()}")
+        st.caption(f"• {capability.replace('_', ' ').title()}")
     
     # Current goals
     if status['current_goals']:
-        st.sidebar.markdown("### 🎯 Current Goals")
+        st.markdown("### 🎯 Current Goals")
         for goal in status['current_goals'][:2]:  # Show first 2 goals
-            st.sidebar.caption(f"• {goal[:50]}...")
+            st.caption(f"• {goal[:50]}...")
 
 def display_solution(solution, verification):
     """Display solution with verification"""
@@ -132,19 +139,15 @@ def display_agentic_enhancement(result):
                     st.markdown(f"**Explored Question {i}:** `{res['question']}`")
                     st.warning(f"**Result:** Could not solve. The agent will learn from this failure.")
 
-def display_solution_from_agent(agent_response: str):
-    """Displays the comprehensive solution provided by the agent."""
-    st.markdown("## 🤖 Agentic Solution")
-    with st.expander("View Full Agent Response", expanded=True):
-        st.markdown(agent_response)
-
 # Main app
 def main():
     st.title("🔬 Physics AI Assistant")
     st.markdown("**A truly agentic physics problem solver.**")
     
     agent = initialize_agentic_system()
-    
+    with st.sidebar:
+        display_agentic_status(agent)
+
     # --- Sidebar for Examples ---
     st.sidebar.title("🚀 Example Problems")
     st.sidebar.markdown("Click a button to load an example problem into the text area.")
@@ -176,23 +179,25 @@ def main():
         height=150
     )
     
-    if st.button("🧠 Solve with Agent", type="primary"):
-        if st.session_state.problem_text.strip(): # Read from session state
-            with st.spinner("🤖 The agent is thinking... This may take a moment."):
-                try:
-                    # This is the new, simplified, agent-driven call
-                    result = agent.run_agentic_pipeline(st.session_state.problem_text)
-                    
-                    if result and result["success"]:
-                        # Display the agent's final, synthesized response
-                        display_solution_from_agent(result["response"])
-                    else:
-                        st.error(f"The agent failed to produce a solution. Error: {result.get('response', 'Unknown error')}")
-                        
-                except Exception as e:
-                    st.error(f"A critical error occurred: {str(e)}")
-        else:
-            st.warning("Please enter a physics problem.")
+    # Fragment: only this block reruns on the solve click, so the long
+    # streaming LLM call doesn't re-execute the sidebar or example buttons
+    @st.fragment
+    def solve_block():
+        if st.button("🧠 Solve with Agent", type="primary"):
+            if st.session_state.problem_text.strip(): # Read from session state
+                with st.spinner("🤖 The agent is thinking... This may take a moment."):
+                    try:
+                        # Stream the agent's response so tokens render as they
+                        # arrive instead of blocking on the full generation
+                        st.markdown("## 🤖 Agentic Solution")
+                        st.write_stream(agent.stream_agentic_pipeline(st.session_state.problem_text))
+
+                    except Exception as e:
+                        st.error(f"A critical error occurred: {str(e)}")
+            else:
+                st.warning("Please enter a physics problem.")
+
+    solve_block()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
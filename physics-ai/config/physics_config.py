@@ -1,46 +1,74 @@
 """Configuration for physics simulation parameters"""
+from dataclasses import dataclass
 
-class PhysicsConfig:
+# Module-level numeric constants. Compiled kernels (e.g. numba @njit
+# functions) should import these directly — the JIT folds module globals
+# into the compiled code as constants, whereas class/instance attribute
+# reads stay as Python-level lookups inside the loop.
+GRAVITY = 9.81  # m/s^2
+TIME_STEP = 1 / 240  # seconds
+MAX_SIMULATION_STEPS = 1000
+BALL_RADIUS = 0.1  # meters
+STRING_LENGTH = 1.0  # meters
+RESTITUTION = 1.0  # elastic collision
+AIR_RESISTANCE = 0.0
+
+# Frozen slotted dataclasses: attribute reads are C-level slot fetches
+# instead of dict lookups, and the shared instances are immutable so
+# simulation runs can't drift each other's parameters.
+
+@dataclass(frozen=True, slots=True)
+class CollisionConfig:
+    ball_radius: float = BALL_RADIUS  # meters
+    collision_threshold: float = 0.2  # meters
+    separation_threshold: float = 0.2  # meters
+    initial_separation: float = 1.0  # meters
+    restitution: float = RESTITUTION  # elastic collision
+    friction: float = 0.0  # no friction
+
+
+@dataclass(frozen=True, slots=True)
+class PendulumConfig:
+    bob_radius: float = BALL_RADIUS  # meters
+    string_length: float = STRING_LENGTH  # meters
+    initial_angle: float = 30.0  # degrees
+    damping: float = 0.0  # no damping
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectileConfig:
+    object_radius: float = BALL_RADIUS  # meters
+    air_resistance: float = AIR_RESISTANCE  # no air resistance
+    default_angle: float = 45.0  # degrees
+
+
+@dataclass(frozen=True, slots=True)
+class FreeFallConfig:
+    object_radius: float = BALL_RADIUS  # meters
+    air_resistance: float = AIR_RESISTANCE  # no air resistance
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationConfig:
+    gravity: tuple = (0.0, 0.0, -GRAVITY)  # m/s^2
+    time_step: float = TIME_STEP  # seconds
+    max_steps: int = MAX_SIMULATION_STEPS
+    debug_mode: bool = False  # enable/disable debug output
+
+
+@dataclass(frozen=True, slots=True)
+class _PhysicsConfig:
     # General physics constants
-    GRAVITY = 9.81  # m/s^2
-    TIME_STEP = 1/240  # seconds
-    MAX_SIMULATION_STEPS = 1000
-
-    # Collision parameters
-    COLLISION = {
-        'ball_radius': 0.1,  # meters
-        'collision_threshold': 0.2,  # meters
-        'separation_threshold': 0.2,  # meters
-        'initial_separation': 1.0,  # meters
-        'restitution': 1.0,  # elastic collision
-        'friction': 0.0,  # no friction
-    }
-
-    # Pendulum parameters
-    PENDULUM = {
-        'bob_radius': 0.1,  # meters
-        'string_length': 1.0,  # meters
-        'initial_angle': 30.0,  # degrees
-        'damping': 0.0,  # no damping
-    }
-
-    # Projectile parameters
-    PROJECTILE = {
-        'object_radius': 0.1,  # meters
-        'air_resistance': 0.0,  # no air resistance
-        'default_angle': 45.0,  # degrees
-    }
-
-    # Free fall parameters
-    FREE_FALL = {
-        'object_radius': 0.1,  # meters
-        'air_resistance': 0.0,  # no air resistance
-    }
-
-    # Simulation parameters
-    SIMULATION = {
-        'gravity': [0, 0, -GRAVITY],  # m/s^2
-        'time_step': TIME_STEP,  # seconds
-        'max_steps': MAX_SIMULATION_STEPS,
-        'debug_mode': False,  # enable/disable debug output
-    } 
\ No newline at end of file
+    GRAVITY: float = GRAVITY  # m/s^2
+    TIME_STEP: float = TIME_STEP  # seconds
+    MAX_SIMULATION_STEPS: int = MAX_SIMULATION_STEPS
+
+    COLLISION: CollisionConfig = CollisionConfig()
+    PENDULUM: PendulumConfig = PendulumConfig()
+    PROJECTILE: ProjectileConfig = ProjectileConfig()
+    FREE_FALL: FreeFallConfig = FreeFallConfig()
+    SIMULATION: SimulationConfig = SimulationConfig()
+
+
+# Shared immutable instance; importers keep using PhysicsConfig.GRAVITY etc.
+PhysicsConfig = _PhysicsConfig()
@@ -1,35 +1,45 @@
 # config/settings.py
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
-class Config:
+# Frozen slotted dataclass: attribute reads (Config.GRAVITY shows up in the
+# solver's inner formulas) are C-level slot fetches, and the settings can't
+# be mutated at runtime behind the solver's back.
+@dataclass(frozen=True, slots=True)
+class _Config:
     # API Keys
-    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    
+    OPENAI_API_KEY: Optional[str] = None
+
     # LLM Configuration
-    LLM_MODEL = "gpt-4"  # or "gpt-3.5-turbo" for faster/cheaper
-    LLM_TEMPERATURE = 0.1
-    LLM_MAX_TOKENS = 1000
-    
+    LLM_MODEL: str = "gpt-4"  # or "gpt-3.5-turbo" for faster/cheaper
+    LLM_TEMPERATURE: float = 0.1
+    LLM_MAX_TOKENS: int = 1000
+
     # Physics Constants
-    GRAVITY = 9.81  # m/s^2
-    AIR_DENSITY = 1.225  # kg/m^3
-    
+    GRAVITY: float = 9.81  # m/s^2
+    AIR_DENSITY: float = 1.225  # kg/m^3
+
     # Simulation Settings
-    SIMULATION_TIMESTEP = 0.01  # seconds
-    MAX_SIMULATION_TIME = 100   # seconds
-    
+    SIMULATION_TIMESTEP: float = 0.01  # seconds
+    MAX_SIMULATION_TIME: int = 100   # seconds
+
     # Confidence Thresholds
-    HIGH_CONFIDENCE_THRESHOLD = 0.9
-    MEDIUM_CONFIDENCE_THRESHOLD = 0.7
-    
+    HIGH_CONFIDENCE_THRESHOLD: float = 0.9
+    MEDIUM_CONFIDENCE_THRESHOLD: float = 0.7
+
     # File Paths
-    PHYSICS_KNOWLEDGE_PATH = "data/physics_knowledge.json"
-    PROBLEM_EXAMPLES_PATH = "data/problem_examples.json"
-    
+    PHYSICS_KNOWLEDGE_PATH: str = "data/physics_knowledge.json"
+    PROBLEM_EXAMPLES_PATH: str = "data/problem_examples.json"
+
     # Agent Configuration
-    AGENT_MEMORY_PATH = "data/agent_memory"
-    AGENT_MAX_ITERATIONS = 5
-    AGENT_VERBOSE = True
\ No newline at end of file
+    AGENT_MEMORY_PATH: str = "data/agent_memory"
+    AGENT_MAX_ITERATIONS: int = 5
+    AGENT_VERBOSE: bool = True
+
+
+# Shared immutable instance; importers keep using Config.LLM_MODEL etc.
+Config = _Config(OPENAI_API_KEY=os.getenv('OPENAI_API_KEY'))
@@ -0,0 +1,175 @@
+# core/_kernels.py
+"""Numba-compiled kinematic kernels for the analytical solvers.
+
+Signatures are pre-declared so compilation happens eagerly at import
+(cache=True persists the compiled artifacts across runs). When numba is
+not installed the kernels run as plain Python functions with identical
+results, so the solver works either way.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_ENABLED = True
+except ImportError:
+    NUMBA_ENABLED = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit('UniTuple(f8, 6)(f8, f8, f8, f8)', cache=True, fastmath=True)
+def projectile_kernel(v0, angle_deg, h, g):
+    """Projectile motion: (range, time_flight, max_height, vf, vfx, vfy)"""
+    angle_rad = math.radians(angle_deg)
+    v0x = v0 * math.cos(angle_rad)
+    v0y = v0 * math.sin(angle_rad)
+
+    # Ground-level launch (the common case): symmetric trajectory, so
+    # t = 2*v0y/g and the landing speed equals the launch speed — no
+    # sqrt or discriminant needed
+    if h == 0.0 and v0y >= 0.0:
+        time_flight = 2.0 * v0y / g
+        return (v0x * time_flight, time_flight, v0y * v0y / (2.0 * g),
+                v0, v0x, -v0y)
+
+    # Closed-form time of flight for h = h0 + v0y*t - 0.5*g*t^2 = 0:
+    # t = (v0y + sqrt(v0y^2 + 2gh)) / g. Picking the positive root
+    # directly avoids the quadratic's sign-flip branch and the
+    # cancellation-prone -b +/- sqrt(disc) form near h = 0.
+    disc = v0y * v0y + 2.0 * g * h
+    time_flight = (v0y + math.sqrt(disc)) / g
+
+    range_x = v0x * time_flight
+
+    # Apex from energy: h_max = h + v0y^2 / 2g
+    max_height = h + v0y * v0y / (2.0 * g)
+
+    final_velocity_y = v0y - g * time_flight
+    # hypot: scaled libm routine, no overflow/underflow on the squares
+    final_velocity = math.hypot(v0x, final_velocity_y)
+
+    return range_x, time_flight, max_height, final_velocity, v0x, final_velocity_y
+
+
+@njit('UniTuple(f8, 3)(f8, f8, f8)', cache=True, fastmath=True)
+def free_fall_kernel(height, time, g):
+    """Free fall: (distance, final_velocity, time_fall)"""
+    if time > 0:
+        return 0.5 * g * time * time, g * time, time
+    return height, math.sqrt(2.0 * g * height), math.sqrt(2.0 * height / g)
+
+
+@njit('UniTuple(f8, 3)(f8, f8, f8)', cache=True, fastmath=True)
+def pendulum_kernel(length, initial_angle_deg, g):
+    """Pendulum (small angle): (period, max_velocity, frequency)"""
+    period = 2.0 * math.pi * math.sqrt(length / g)
+    height = length * (1.0 - math.cos(math.radians(initial_angle_deg)))
+    max_velocity = math.sqrt(2.0 * g * height)
+    frequency = 1.0 / period if period > 0 else 0.0
+    return period, max_velocity, frequency
+
+
+@njit('UniTuple(f8, 2)(f8, f8, f8, f8)', cache=True, fastmath=True)
+def collision_kernel(mass_a, mass_b, velocity_a, velocity_b):
+    """Elastic collision: (velocity_a_final, velocity_b_final)"""
+    total_mass = mass_a + mass_b
+    velocity_a_final = ((mass_a - mass_b) * velocity_a + 2.0 * mass_b * velocity_b) / total_mass
+    velocity_b_final = ((mass_b - mass_a) * velocity_b + 2.0 * mass_a * velocity_a) / total_mass
+    return velocity_a_final, velocity_b_final
+
+
+@njit('f8[:](f8, f8, f8, f8, i8)', cache=True)
+def pendulum_ode_kernel(length, theta0, g, dt, n_steps):
+    """Leapfrog integration of theta'' = -(g/L) sin(theta); returns theta[:]"""
+    theta = np.empty(n_steps)
+    th = theta0
+    omega = 0.0
+    # kick-drift-kick: half-step the angular velocity first so the
+    # integrator stays symplectic (energy doesn't drift over 3 periods)
+    omega += 0.5 * dt * (-(g / length) * math.sin(th))
+    for i in range(n_steps):
+        th += dt * omega
+        omega += dt * (-(g / length) * math.sin(th))
+        theta[i] = th
+    return theta
+
+
+@njit('UniTuple(f8, 2)(f8, f8, f8)', cache=True, fastmath=True)
+def free_fall_time_kernel(height, initial_velocity, g):
+    """Fall time from height with downward v0: (time, final_velocity)"""
+    disc = initial_velocity * initial_velocity + 2.0 * g * height
+    if disc >= 0.0:
+        t = (-initial_velocity + math.sqrt(disc)) / g
+    else:
+        t = 0.0
+    return t, initial_velocity + g * t
+
+
+@njit('UniTuple(f8, 2)(f8, f8, f8, f8, f8)', cache=True, fastmath=True)
+def collision_restitution_kernel(m1, v1, m2, v2, e):
+    """1D collision with restitution e: (v1_final, v2_final)"""
+    relative_velocity = v1 - v2
+    v1f = (m1 * v1 + m2 * v2 - m2 * e * relative_velocity) / (m1 + m2)
+    return v1f, v1f + e * relative_velocity
+
+
+@njit('UniTuple(f8, 3)(f8, f8, f8)', cache=True, fastmath=True)
+def pendulum_elliptic_kernel(length, angle_max_deg, g):
+    """Pendulum with elliptic correction: (period_small, period_accurate, v_max)"""
+    period_small = 2.0 * math.pi * math.sqrt(length / g)
+    angle_rad = math.radians(angle_max_deg)
+    k = math.sin(0.5 * angle_rad)
+    k2 = k * k
+    period_accurate = period_small * (1.0 + 0.25 * k2 + 0.0625 * k2 * k2)
+    v_max = math.sqrt(2.0 * g * length * (1.0 - math.cos(angle_rad)))
+    return period_small, period_accurate, v_max
+
+
+@njit('UniTuple(f8[:], 2)(f8[:], f8[:], f8)', parallel=True, cache=True, fastmath=True)
+def pendulum_batch_kernel(lengths, angles_deg, g):
+    """Elliptic-corrected periods and max velocities over independent pendula"""
+    n = lengths.size
+    out_period = np.empty(n)
+    out_v_max = np.empty(n)
+    # Independent elements: prange spreads the trig/sqrt work over cores
+    for i in prange(n):
+        angle_rad = math.radians(angles_deg[i])
+        k = math.sin(0.5 * angle_rad)
+        k2 = k * k
+        period_small = 2.0 * math.pi * math.sqrt(lengths[i] / g)
+        out_period[i] = period_small * (1.0 + 0.25 * k2 + 0.0625 * k2 * k2)
+        out_v_max[i] = math.sqrt(2.0 * g * lengths[i] * (1.0 - math.cos(angle_rad)))
+    return out_period, out_v_max
+
+
+@njit('void(f8[:], f8, f8[:], f8[:])', parallel=True, cache=True, fastmath=True)
+def sin_cos_scaled_kernel(a, amp, out_s, out_c):
+    """Fill out_s/out_c with amp*sin(a) and amp*cos(a)"""
+    # nogil by construction: concurrent figure builds in a threadpool
+    # run this on real cores instead of serializing on the GIL
+    for i in prange(a.shape[0]):
+        out_s[i] = amp * math.sin(a[i])
+        out_c[i] = amp * math.cos(a[i])
+
+
+@njit('void(f8, f8, f8, f8, f8[:], f8[:], f8[:])', cache=True, fastmath=True)
+def trajectory_xy_kernel(v0, angle_rad, height, g, t, x, y):
+    """Fill preallocated x/y buffers with the projectile trajectory"""
+    c = math.cos(angle_rad)
+    s = math.sin(angle_rad)
+    v0x = v0 * c
+    v0y = v0 * s
+    # Single fused loop: no intermediate arrays for t**2 etc.
+    for i in range(t.shape[0]):
+        ti = t[i]
+        x[i] = v0x * ti
+        y[i] = ti * (v0y - 0.5 * g * ti) + height
@@ -0,0 +1,21 @@
+# core/analytical.py
+"""Closed-form physics results that need no engine.
+
+Importable without pybullet: clients that only need these (graders,
+batch scoring) skip the physics-engine import entirely.
+"""
+import numpy as np
+
+
+def elastic_collision_1d(mass_a, mass_b, velocity_a, velocity_b):
+    """Final velocities of a 1D elastic collision.
+
+    Accepts scalars or same-shaped NumPy arrays — the fused expression
+    evaluates element-wise via ufuncs either way. The general formula
+    reduces to the velocity swap for equal masses, so no special case.
+    """
+    inv_sum = 1.0 / (mass_a + mass_b)
+    return {
+        'velocity_a_final': ((mass_a - mass_b) * velocity_a + 2.0 * mass_b * velocity_b) * inv_sum,
+        'velocity_b_final': (2.0 * mass_a * velocity_a + (mass_b - mass_a) * velocity_b) * inv_sum
+    }
@@ -1,25 +1,77 @@
 # core/learning_memory.py
+import atexit
 import json
 import sqlite3
-import hashlib
+from collections import deque
+import xxhash
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 from utils.data_models import PhysicsProblem, Solution, VerificationResult
 
+_U64 = (1 << 64) - 1
+
 class LearningMemory:
     def __init__(self, db_path: str = "data/physics_memory.db"):
         self.db_path = db_path
+        self._conn = None
         self._ensure_db_exists()
-        self.success_patterns = {}
+        # success_patterns is authoritative in memory: loaded once here,
+        # updated in O(1) per solve, and flushed back to SQLite in batches
+        self.success_patterns = self._load_success_patterns()
+        self._dirty_patterns = set()
+        self._flush_threshold = 16
+        # Write-behind buffer for problem_history rows: exploration sessions
+        # store many problems back-to-back, and one executemany transaction
+        # per batch beats one INSERT + fsync per problem
+        self._history_queue: deque = deque()
+        # Best-method memo per problem_type; entries are busted whenever a
+        # pattern update for that type lands, so stale answers can't persist
+        self._best_method_cache: Dict[str, Optional[str]] = {}
         self.error_patterns = {}
         self.user_preferences = {}
-    
+        atexit.register(self.close)
+
+    def _load_success_patterns(self) -> Dict:
+        """Load the success_patterns table into memory (one query at init)"""
+        rows = self._get_conn().execute('''
+            SELECT method_name, problem_type, success_rate, avg_confidence, usage_count
+            FROM success_patterns
+        ''').fetchall()
+        return {(row[0], row[1]): (row[2], row[3], row[4]) for row in rows}
+
+    @staticmethod
+    def _now_iso() -> str:
+        """Single UTC timestamp string per call scope (captured once, passed through)"""
+        return datetime.now(timezone.utc).isoformat()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use.
+
+        One long-lived WAL-mode connection replaces the old
+        connect/execute/close cycle that paid connection setup and an
+        fsync on every statement.
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('PRAGMA temp_store=MEMORY')
+        return self._conn
+
+    def close(self):
+        """Flush pending writes and close the connection (registered with atexit)."""
+        if self._conn is not None:
+            self._flush_history()
+            self._flush_success_patterns()
+            self._conn.close()
+            self._conn = None
+
     def _ensure_db_exists(self):
         """Create database and tables if they don't exist"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         # Create tables
@@ -35,10 +87,16 @@ class LearningMemory:
                 agreement_score REAL,
                 confidence REAL,
                 timestamp TEXT,
-                was_correct BOOLEAN
+                was_correct BOOLEAN,
+                simhash INTEGER
             )
         ''')
-        
+
+        try:
+            cursor.execute('ALTER TABLE problem_history ADD COLUMN simhash INTEGER')
+        except sqlite3.OperationalError:
+            pass  # column already present (or table just created with it)
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS error_patterns (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,6 +107,13 @@ class LearningMemory:
                 last_seen TEXT
             )
         ''')
+
+        # B-tree probe instead of a full scan for the per-store lookup;
+        # also the unique key store_error_pattern's UPSERT conflicts on
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_error
+            ON error_patterns(error_type, problem_type)
+        ''')
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS success_patterns (
@@ -61,94 +126,155 @@ class LearningMemory:
                 last_used TEXT
             )
         ''')
+
+        # As with idx_error: a separate unique index (rather than a table
+        # constraint inside CREATE TABLE IF NOT EXISTS) also reaches
+        # databases created before the constraint existed, which the
+        # success-pattern UPSERT needs to resolve its conflicts against
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_success
+            ON success_patterns(method_name, problem_type)
+        ''')
+
+        # Full-text index over problem_text, kept in sync by triggers, so
+        # similarity search runs on SQLite's inverted index instead of a
+        # Python scan over every stored problem
+        try:
+            fts_existed = cursor.execute('''
+                SELECT 1 FROM sqlite_master WHERE type='table' AND name='problem_fts'
+            ''').fetchone() is not None
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS problem_fts USING fts5(
+                    problem_text, content='problem_history', content_rowid='id'
+                )
+            ''')
+            cursor.executescript('''
+                CREATE TRIGGER IF NOT EXISTS problem_history_ai AFTER INSERT ON problem_history BEGIN
+                    INSERT INTO problem_fts(rowid, problem_text) VALUES (new.id, new.problem_text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS problem_history_ad AFTER DELETE ON problem_history BEGIN
+                    INSERT INTO problem_fts(problem_fts, rowid, problem_text)
+                    VALUES ('delete', old.id, old.problem_text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS problem_history_au AFTER UPDATE ON problem_history BEGIN
+                    INSERT INTO problem_fts(problem_fts, rowid, problem_text)
+                    VALUES ('delete', old.id, old.problem_text);
+                    INSERT INTO problem_fts(rowid, problem_text) VALUES (new.id, new.problem_text);
+                END;
+            ''')
+            if not fts_existed:
+                # The triggers only index future mutations; on a database
+                # that already has history rows, rebuild once so existing
+                # problems stay visible to similarity search
+                cursor.execute('''
+                    INSERT INTO problem_fts(problem_fts) VALUES('rebuild')
+                ''')
+            self._fts_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite built without the FTS5 module
+            self._fts_enabled = False
         
         conn.commit()
-        conn.close()
     
     def store_problem_solution(self, problem: PhysicsProblem, solution: Solution, 
                              verification: VerificationResult, was_correct: bool = True):
         """Store a solved problem and its results for learning"""
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+
         # Create unique hash for problem
         problem_hash = self._hash_problem(problem.problem_text)
-        
+
+        # Buffer the row and mark the success-pattern delta in memory; both
+        # reach SQLite in batched flushes rather than per-problem commits
+        self._history_queue.append((
+            problem_hash,
+            problem.problem_text,
+            problem.problem_type.value,
+            solution.method,
+            str(solution.answer),
+            str(verification.simulation_result),
+            verification.agreement_score,
+            verification.confidence,
+            self._now_iso(),
+            was_correct,
+            self._to_signed(self._simhash(problem.problem_text))
+        ))
+        self._update_success_pattern(solution.method, problem.problem_type.value,
+                                     verification.confidence, was_correct)
+
+        if len(self._history_queue) >= self._flush_threshold:
+            self._flush_history()
+
+    def _flush_history(self):
+        """Drain the write-behind queue into problem_history in one batch"""
+
+        if not self._history_queue:
+            return
+
+        conn = self._get_conn()
+        rows = list(self._history_queue)
+
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO problem_history 
-                (problem_hash, problem_text, problem_type, solution_method,
-                 analytical_result, simulation_result, agreement_score, 
-                 confidence, timestamp, was_correct)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                problem_hash,
-                problem.problem_text,
-                problem.problem_type.value,
-                solution.method,
-                str(solution.answer),
-                str(verification.simulation_result),
-                verification.agreement_score,
-                verification.confidence,
-                datetime.now().isoformat(),
-                was_correct
-            ))
-            
-            # Update success patterns
-            self._update_success_pattern(solution.method, problem.problem_type.value, 
-                                       verification.confidence, was_correct)
-            
-            conn.commit()
-            
+            # UPSERT rather than INSERT OR REPLACE: REPLACE resolves the
+            # problem_hash conflict by deleting the old row, and that
+            # implicit delete doesn't fire the AFTER DELETE trigger (while
+            # the insert trigger still fires), leaving ghost entries in
+            # problem_fts. DO UPDATE fires the AFTER UPDATE trigger, which
+            # keeps the external-content index consistent.
+            with conn:
+                conn.executemany('''
+                    INSERT INTO problem_history
+                    (problem_hash, problem_text, problem_type, solution_method,
+                     analytical_result, simulation_result, agreement_score,
+                     confidence, timestamp, was_correct, simhash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(problem_hash) DO UPDATE SET
+                        problem_text = excluded.problem_text,
+                        problem_type = excluded.problem_type,
+                        solution_method = excluded.solution_method,
+                        analytical_result = excluded.analytical_result,
+                        simulation_result = excluded.simulation_result,
+                        agreement_score = excluded.agreement_score,
+                        confidence = excluded.confidence,
+                        timestamp = excluded.timestamp,
+                        was_correct = excluded.was_correct,
+                        simhash = excluded.simhash
+                ''', rows)
+            self._history_queue.clear()
+
         except sqlite3.Error as e:
             print(f"Database error: {e}")
-        finally:
-            conn.close()
     
     def store_error_pattern(self, error_type: str, problem_type: str, description: str):
         """Store information about errors for learning"""
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        conn = self._get_conn()
+
         try:
-            # Check if this error pattern already exists
-            cursor.execute('''
-                SELECT id, frequency FROM error_patterns 
-                WHERE error_type = ? AND problem_type = ?
-            ''', (error_type, problem_type))
-            
-            result = cursor.fetchone()
-            
-            if result:
-                # Update existing pattern
-                cursor.execute('''
-                    UPDATE error_patterns 
-                    SET frequency = frequency + 1, last_seen = ?
-                    WHERE id = ?
-                ''', (datetime.now().isoformat(), result[0]))
-            else:
-                # Insert new pattern
-                cursor.execute('''
-                    INSERT INTO error_patterns 
+            # One UPSERT against the unique (error_type, problem_type) index
+            # replaces the SELECT-then-UPDATE/INSERT round-trips
+            with conn:
+                conn.execute('''
+                    INSERT INTO error_patterns
                     (error_type, problem_type, description, last_seen)
                     VALUES (?, ?, ?, ?)
-                ''', (error_type, problem_type, description, datetime.now().isoformat()))
-            
-            conn.commit()
-            
+                    ON CONFLICT(error_type, problem_type) DO UPDATE SET
+                        frequency = frequency + 1,
+                        last_seen = excluded.last_seen
+                ''', (error_type, problem_type, description, self._now_iso()))
+
         except sqlite3.Error as e:
             print(f"Error storing error pattern: {e}")
-        finally:
-            conn.close()
     
     def get_best_method_for_problem(self, problem_type: str) -> Optional[str]:
         """Get the most successful method for a given problem type"""
-        
-        conn = sqlite3.connect(self.db_path)
+
+        if problem_type in self._best_method_cache:
+            return self._best_method_cache[problem_type]
+
+        self._flush_success_patterns()
+        conn = self._get_conn()
         cursor = conn.cursor()
-        
+
         try:
             cursor.execute('''
                 SELECT method_name, success_rate, avg_confidence
@@ -159,85 +285,124 @@ class LearningMemory:
             ''', (problem_type,))
             
             result = cursor.fetchone()
-            return result[0] if result else None
-            
+            best_method = result[0] if result else None
+            self._best_method_cache[problem_type] = best_method
+            return best_method
+
         except sqlite3.Error as e:
             print(f"Error retrieving best method: {e}")
             return None
-        finally:
-            conn.close()
     
     def get_similar_problems(self, problem_text: str, limit: int = 5) -> List[Dict]:
         """Find similar problems solved before"""
-        
-        conn = sqlite3.connect(self.db_path)
+
+        self._flush_history()
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         try:
-            # Simple similarity based on common words
-            # In a real system, you'd use more sophisticated NLP
-            keywords = set(problem_text.lower().split())
-            
-            cursor.execute('''
-                SELECT problem_text, solution_method, analytical_result, 
-                       confidence, timestamp
-                FROM problem_history 
-                WHERE was_correct = 1
-                ORDER BY confidence DESC
-                LIMIT ?
-            ''', (limit * 3,))  # Get more to filter
-            
-            results = cursor.fetchall()
-            similar_problems = []
-            
-            for result in results:
-                stored_problem = result[0]
-                stored_keywords = set(stored_problem.lower().split())
+            if self._fts_enabled:
+                # Let FTS5 tokenize and rank in native C: BM25 over an
+                # inverted index instead of a Jaccard scan of every row
+                terms = [t for t in problem_text.lower().split() if t.isalnum()]
+                if not terms:
+                    return []
+                match_query = ' OR '.join(terms)
                 
-                # Calculate simple similarity score
-                common_words = keywords.intersection(stored_keywords)
-                similarity = len(common_words) / max(len(keywords), len(stored_keywords))
+                cursor.execute('''
+                    SELECT h.problem_text, h.solution_method, h.analytical_result,
+                           h.confidence, h.timestamp, bm25(problem_fts) AS rank
+                    FROM problem_fts
+                    JOIN problem_history h ON h.id = problem_fts.rowid
+                    WHERE problem_fts MATCH ? AND h.was_correct = 1
+                    ORDER BY rank
+                    LIMIT ?
+                ''', (match_query, limit))
                 
-                if similarity > 0.3:  # Threshold for similarity
-                    similar_problems.append({
-                        'problem_text': stored_problem,
-                        'method': result[1],
-                        'result': result[2],
-                        'confidence': result[3],
-                        'similarity': similarity,
-                        'timestamp': result[4]
-                    })
+                return [
+                    {
+                        'problem_text': row[0],
+                        'method': row[1],
+                        'result': row[2],
+                        'confidence': row[3],
+                        'similarity': -row[5],  # bm25: lower rank = better match
+                        'timestamp': row[4]
+                    }
+                    for row in cursor.fetchall()
+                ]
             
-            # Sort by similarity and return top results
-            similar_problems.sort(key=lambda x: x['similarity'], reverse=True)
-            return similar_problems[:limit]
+            return self._get_similar_problems_fallback(cursor, problem_text, limit)
             
         except sqlite3.Error as e:
             print(f"Error finding similar problems: {e}")
             return []
-        finally:
-            conn.close()
+    
+    def _get_similar_problems_fallback(self, cursor, problem_text: str, limit: int) -> List[Dict]:
+        """Python-side similarity scan for SQLite builds without FTS5"""
+
+        # Compare 64-bit SimHash fingerprints stored at insert time: one
+        # XOR + popcount per row instead of rebuilding a token set per
+        # candidate. Rows predating the simhash column are hashed lazily.
+        query_hash = self._simhash(problem_text)
+
+        # Stream rows in batches of 64 and stop once `limit` matches are in
+        # hand — highest-confidence rows come first, so the tail of a large
+        # corpus is never materialized
+        cursor.arraysize = 64
+        cursor.execute('''
+            SELECT problem_text, solution_method, analytical_result,
+                   confidence, timestamp, simhash
+            FROM problem_history
+            WHERE was_correct = 1
+            ORDER BY confidence DESC
+        ''')
+
+        similar_problems = []
+
+        for result in cursor:
+            stored_problem = result[0]
+            stored_hash = result[5] if result[5] is not None else self._simhash(stored_problem)
+
+            distance = ((query_hash ^ stored_hash) & _U64).bit_count()
+            similarity = 1 - distance / 64
+
+            if similarity > 0.7:  # Threshold for similarity (<= ~19 differing bits)
+                similar_problems.append({
+                    'problem_text': stored_problem,
+                    'method': result[1],
+                    'result': result[2],
+                    'confidence': result[3],
+                    'similarity': similarity,
+                    'timestamp': result[4]
+                })
+                if len(similar_problems) == limit:
+                    break
+
+        # Sort by similarity and return top results
+        similar_problems.sort(key=lambda x: x['similarity'], reverse=True)
+        return similar_problems[:limit]
     
     def get_learning_insights(self) -> Dict[str, Any]:
         """Get insights about system performance and learning"""
-        
-        conn = sqlite3.connect(self.db_path)
+
+        self._flush_history()
+        self._flush_success_patterns()
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         insights = {}
         
         try:
-            # Overall statistics
-            cursor.execute('SELECT COUNT(*) FROM problem_history')
-            insights['total_problems_solved'] = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT AVG(confidence) FROM problem_history WHERE was_correct = 1')
-            result = cursor.fetchone()
-            insights['average_confidence'] = result[0] if result[0] else 0
-            
-            cursor.execute('SELECT AVG(agreement_score) FROM problem_history')
-            result = cursor.fetchone()
-            insights['average_agreement'] = result[0] if result[0] else 0
+            # Overall statistics in one round-trip instead of three
+            cursor.execute('''
+                SELECT (SELECT COUNT(*) FROM problem_history),
+                       (SELECT AVG(confidence) FROM problem_history WHERE was_correct = 1),
+                       (SELECT AVG(agreement_score) FROM problem_history)
+            ''')
+            total, avg_confidence, avg_agreement = cursor.fetchone()
+            insights['total_problems_solved'] = total
+            insights['average_confidence'] = avg_confidence if avg_confidence else 0
+            insights['average_agreement'] = avg_agreement if avg_agreement else 0
             
             # Most successful methods
             cursor.execute('''
@@ -268,58 +433,76 @@ class LearningMemory:
             
         except sqlite3.Error as e:
             print(f"Error generating insights: {e}")
-        finally:
-            conn.close()
         
         return insights
     
     def _hash_problem(self, problem_text: str) -> str:
         """Create a unique hash for a problem"""
-        return hashlib.md5(problem_text.encode()).hexdigest()
+        # xxh3 is a non-cryptographic hash, 5-20x faster than MD5 on the
+        # short strings we dedupe on; this runs for every stored problem
+        return xxhash.xxh3_64_hexdigest(problem_text.encode())
     
-    def _update_success_pattern(self, method: str, problem_type: str, 
+    def _simhash(self, text: str) -> int:
+        """64-bit SimHash of the whitespace-tokenized text"""
+        weights = [0] * 64
+        for token in set(text.lower().split()):
+            token_hash = xxhash.xxh3_64_intdigest(token)
+            for bit in range(64):
+                weights[bit] += 1 if (token_hash >> bit) & 1 else -1
+        fingerprint = 0
+        for bit, weight in enumerate(weights):
+            if weight > 0:
+                fingerprint |= 1 << bit
+        return fingerprint
+
+    @staticmethod
+    def _to_signed(value: int) -> int:
+        """Reinterpret an unsigned 64-bit int as signed (SQLite INTEGER range)"""
+        return value - (1 << 64) if value >= (1 << 63) else value
+
+    def _update_success_pattern(self, method: str, problem_type: str,
                               confidence: float, was_correct: bool):
-        """Update success patterns for a method"""
+        """Update success patterns for a method (in memory; flushed lazily)"""
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        key = (method, problem_type)
+        success_rate, avg_confidence, usage_count = self.success_patterns.get(key, (0.0, 0.0, 0))
+        new_count = usage_count + 1
+        self.success_patterns[key] = (
+            (success_rate * usage_count + (1 if was_correct else 0)) / new_count,
+            (avg_confidence * usage_count + confidence) / new_count,
+            new_count
+        )
+        self._dirty_patterns.add(key)
+        self._best_method_cache.pop(problem_type, None)
+        if len(self._dirty_patterns) >= self._flush_threshold:
+            self._flush_success_patterns()
+    
+    def _flush_success_patterns(self):
+        """Write dirty in-memory success patterns back to SQLite in one batch"""
+        
+        if not self._dirty_patterns:
+            return
+        
+        conn = self._get_conn()
+        now_iso = self._now_iso()
+        rows = [
+            (method, problem_type, *self.success_patterns[(method, problem_type)], now_iso)
+            for method, problem_type in self._dirty_patterns
+        ]
         
         try:
-            # Get existing pattern
-            cursor.execute('''
-                SELECT id, success_rate, avg_confidence, usage_count
-                FROM success_patterns 
-                WHERE method_name = ? AND problem_type = ?
-            ''', (method, problem_type))
-            
-            result = cursor.fetchone()
-            
-            if result:
-                # Update existing pattern
-                pattern_id, old_success_rate, old_avg_confidence, usage_count = result
-                
-                new_usage_count = usage_count + 1
-                new_success_rate = (old_success_rate * usage_count + (1 if was_correct else 0)) / new_usage_count
-                new_avg_confidence = (old_avg_confidence * usage_count + confidence) / new_usage_count
-                
-                cursor.execute('''
-                    UPDATE success_patterns 
-                    SET success_rate = ?, avg_confidence = ?, usage_count = ?, last_used = ?
-                    WHERE id = ?
-                ''', (new_success_rate, new_avg_confidence, new_usage_count, 
-                      datetime.now().isoformat(), pattern_id))
-            else:
-                # Create new pattern
-                cursor.execute('''
+            with conn:
+                conn.executemany('''
                     INSERT INTO success_patterns 
-                    (method_name, problem_type, success_rate, avg_confidence, last_used)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (method, problem_type, 1 if was_correct else 0, confidence, 
-                      datetime.now().isoformat()))
-            
-            conn.commit()
+                    (method_name, problem_type, success_rate, avg_confidence, usage_count, last_used)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(method_name, problem_type) DO UPDATE SET
+                        success_rate = excluded.success_rate,
+                        avg_confidence = excluded.avg_confidence,
+                        usage_count = excluded.usage_count,
+                        last_used = excluded.last_used
+                ''', rows)
+            self._dirty_patterns.clear()
             
         except sqlite3.Error as e:
-            print(f"Error updating success pattern: {e}")
-        finally:
-            conn.close()
\ No newline at end of file
+            print(f"Error updating success pattern: {e}")
\ No newline at end of file
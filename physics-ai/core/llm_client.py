@@ -0,0 +1,25 @@
+# core/llm_client.py
+"""Shared, lazily-constructed OpenAI client.
+
+Building an OpenAI() client sets up an HTTP connection pool and reads
+env/config; purely analytical solves never need that. The client is
+created on first LLM use and shared by the solver and parser so their
+calls reuse one HTTP/2 keep-alive pool.
+"""
+from functools import cache
+
+import httpx
+from openai import OpenAI
+
+from config.settings import Config
+
+
+@cache
+def get_openai_client() -> OpenAI:
+    return OpenAI(
+        api_key=Config.OPENAI_API_KEY,
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8)
+        )
+    )
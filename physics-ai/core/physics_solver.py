@@ -1,92 +1,94 @@
 # core/physics_solver.py
+import dataclasses
 import sympy as sp
 import numpy as np
+from collections import namedtuple
+from functools import lru_cache
 from typing import Dict, Any, List
 from utils.data_models import PhysicsProblem, Solution, ProblemType
 from utils.physics_math import PhysicsMath
+from core._kernels import (projectile_kernel, free_fall_kernel,
+                           pendulum_kernel, collision_kernel)
+from core.llm_client import get_openai_client
 from config.settings import Config
 import math
-import openai
 import json
 import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Pure numeric cores: validation and memoization live here, the float
+# arithmetic itself runs in the (numba-compiled when available) kernels
+# from core._kernels. Inputs are quantized to 9 decimals by the wrappers
+# to avoid FP-identity cache misses; outputs are immutable namedtuples
+# so cached values can be shared without copying.
+
+ProjectileResult = namedtuple('ProjectileResult',
+    ['range', 'time_flight', 'max_height', 'final_velocity',
+     'final_velocity_x', 'final_velocity_y'])
+FreeFallResult = namedtuple('FreeFallResult', ['distance', 'final_velocity', 'time_fall'])
+PendulumResult = namedtuple('PendulumResult', ['period', 'max_velocity', 'frequency'])
+CollisionResult = namedtuple('CollisionResult', ['velocity_a_final', 'velocity_b_final'])
+
+def _quantize(x: float) -> float:
+    return round(float(x), 9)
+
+@lru_cache(maxsize=2048)
+def _projectile_core(initial_velocity: float, angle: float, height: float) -> ProjectileResult:
+    try:
+        result = ProjectileResult(*projectile_kernel(initial_velocity, angle, height, Config.GRAVITY))
+    except ValueError:
+        # pure-Python kernel: math.sqrt raises on a negative discriminant
+        raise ValueError("No real solution for time of flight")
+    if math.isnan(result.time_flight):
+        # numba kernel under fastmath: the same case surfaces as NaN
+        raise ValueError("No real solution for time of flight")
+    return result
+
+@lru_cache(maxsize=2048)
+def _free_fall_core(height: float, time: float) -> FreeFallResult:
+    return FreeFallResult(*free_fall_kernel(height, time, Config.GRAVITY))
+
+@lru_cache(maxsize=2048)
+def _pendulum_core(length: float, initial_angle: float) -> PendulumResult:
+    if length <= 0:
+        raise ValueError("Pendulum length must be a positive value.")
+    return PendulumResult(*pendulum_kernel(length, initial_angle, Config.GRAVITY))
+
+@lru_cache(maxsize=2048)
+def _collision_core(mass_a: float, mass_b: float, velocity_a: float, velocity_b: float) -> CollisionResult:
+    if mass_a <= 0 or mass_b <= 0:
+        raise ValueError("Mass must be greater than zero")
+    return CollisionResult(*collision_kernel(mass_a, mass_b, velocity_a, velocity_b))
 
 class PhysicsSolver:
     def __init__(self):
-        self.client = openai.OpenAI()
         self.math_utils = PhysicsMath()
+
+    @property
+    def client(self):
+        # Lazy shared client: no TLS/pool setup unless the LLM path runs
+        return get_openai_client()
         
     def solve_problem(self, problem: PhysicsProblem) -> Solution:
         """Solve a physics problem"""
+        if isinstance(problem, list):
+            return self.solve_problem_batch(problem)
         try:
-            print(f"Debug PhysicsSolver: Solving {problem.problem_type.value} problem")
-            
-            result = None
-            if problem.problem_type == ProblemType.PROJECTILE:
-                result = self._solve_projectile_motion(
-                    problem.initial_conditions.get('initial_velocity', 0),
-                    problem.initial_conditions.get('angle', 0),
-                    problem.initial_conditions.get('height', 0)
-                )
-                if result:
-                    quantity_asked = problem.initial_conditions.get('quantity_asked', 'range')
-                    if quantity_asked == 'range':
-                        result['answer'] = result['range']
-                        result['unit'] = 'm'
-                    elif quantity_asked == 'max_height':
-                        result['answer'] = result['max_height']
-                        result['unit'] = 'm'
-                    elif quantity_asked == 'time_flight':
-                        result['answer'] = result['time_flight']
-                        result['unit'] = 's'
-                    else:
-                        result['answer'] = result['range']
-                        result['unit'] = 'm'
-                        
-            elif problem.problem_type == ProblemType.FREE_FALL:
-                result = self._solve_free_fall(problem)
-                if result:
-                    quantity_asked = problem.initial_conditions.get('quantity_asked', 'final_velocity')
-                    if quantity_asked == 'final_velocity':
-                        result['answer'] = result['final_velocity']
-                        result['unit'] = 'm/s'
-                    elif quantity_asked == 'distance':
-                        result['answer'] = result['distance']
-                        result['unit'] = 'm'
-                    elif quantity_asked == 'time_fall':
-                        result['answer'] = result['time_fall']
-                        result['unit'] = 's'
-                    else:
-                        result['answer'] = result['final_velocity']
-                        result['unit'] = 'm/s'
-                        
-            elif problem.problem_type == ProblemType.PENDULUM:
-                result = self._solve_pendulum(
-                    problem.initial_conditions.get('length', 0),
-                    problem.initial_conditions.get('initial_angle', 30)
-                )
-                if result:
-                    quantity_asked = problem.initial_conditions.get('quantity_asked', 'period')
-                    if quantity_asked == 'max_velocity':
-                        result['answer'] = result['max_velocity']
-                        result['unit'] = 'm/s'
-                    else:
-                        result['answer'] = result['period']
-                        result['unit'] = 's'
-                        
-            elif problem.problem_type == ProblemType.COLLISION:
-                if len(problem.objects) >= 2:
-                    result = self._solve_collision(
-                        problem.objects[0].mass,
-                        problem.objects[1].mass,
-                        problem.objects[0].velocity,
-                        problem.objects[1].velocity
-                    )
-                    # Collision solver now returns answer, unit, and steps directly
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: Solving {problem.problem_type.value} problem")
             
+            # O(1) dispatch on the problem type; each entry returns a result
+            # dict with answer and unit already selected
+            dispatch = self._SOLVERS.get(problem.problem_type)
+            result = dispatch(self, problem) if dispatch else None
+
             if not result:
                 raise ValueError("Could not solve problem")
             
-            print(f"Debug PhysicsSolver: result={result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: result={result}")
             
             # Create solution object
             solution = Solution(
@@ -97,13 +99,151 @@ class PhysicsSolver:
                 visualization_data=result
             )
             
-            print(f"Debug PhysicsSolver: answer={solution.answer}, unit={solution.unit}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: answer={solution.answer}, unit={solution.unit}")
             return solution
             
         except Exception as e:
-            print(f"Debug PhysicsSolver: Error solving problem - {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: Error solving problem - {str(e)}")
             raise
     
+    def _apply_answer(self, problem: PhysicsProblem, result: dict) -> dict:
+        """Select answer and unit from a result via the (type, quantity) table"""
+        if result and 'answer' not in result:
+            quantity_asked = problem.initial_conditions.get('quantity_asked', '')
+            mapping = self._ANSWER_MAP.get((problem.problem_type, quantity_asked))
+            if mapping is None:
+                mapping = self._ANSWER_MAP[
+                    (problem.problem_type, self._DEFAULT_QUANTITY[problem.problem_type])
+                ]
+            key, unit = mapping
+            result['answer'] = result[key]
+            result['unit'] = unit
+        return result
+
+    def _dispatch_projectile(self, problem: PhysicsProblem) -> dict:
+        return self._apply_answer(problem, self._solve_projectile_motion(
+            problem.initial_conditions.get('initial_velocity', 0),
+            problem.initial_conditions.get('angle', 0),
+            problem.initial_conditions.get('height', 0)
+        ))
+
+    def _dispatch_pendulum(self, problem: PhysicsProblem) -> dict:
+        return self._apply_answer(problem, self._solve_pendulum(
+            problem.initial_conditions.get('length', 0),
+            problem.initial_conditions.get('initial_angle', 30)
+        ))
+
+    def _dispatch_collision(self, problem: PhysicsProblem) -> dict:
+        if len(problem.objects) < 2:
+            return None
+        # Collision solver returns answer, unit, and steps directly
+        return self._solve_collision(
+            problem.objects[0].mass,
+            problem.objects[1].mass,
+            problem.objects[0].velocity,
+            problem.objects[1].velocity
+        )
+
+    def solve_problem_batch(self, problems: List[PhysicsProblem]) -> List[Solution]:
+        """Solve a list of problems, vectorizing the homogeneous groups.
+
+        Projectile and collision problems are collected into arrays and
+        solved with one NumPy pass each (interpreter overhead paid once
+        per batch, SIMD math per element); everything else falls back to
+        the scalar path.
+        """
+        solutions: List[Any] = [None] * len(problems)
+        projectile_idx = [i for i, p in enumerate(problems)
+                          if p.problem_type == ProblemType.PROJECTILE]
+
+        if len(projectile_idx) >= 2:
+            v0 = np.array([problems[i].initial_conditions.get('initial_velocity', 0)
+                           for i in projectile_idx], dtype=np.float64)
+            angle = np.array([problems[i].initial_conditions.get('angle', 0)
+                              for i in projectile_idx], dtype=np.float64)
+            h = np.array([problems[i].initial_conditions.get('height', 0)
+                          for i in projectile_idx], dtype=np.float64)
+            batch = self._solve_projectile_motion_batch(v0, angle, h)
+
+            units = {'range': 'm', 'max_height': 'm', 'time_flight': 's'}
+            for j, i in enumerate(projectile_idx):
+                quantity_asked = problems[i].initial_conditions.get('quantity_asked', 'range')
+                if quantity_asked not in units:
+                    quantity_asked = 'range'
+                row = batch[j]
+                solutions[i] = Solution(
+                    answer=float(getattr(row, quantity_asked)),
+                    unit=units[quantity_asked],
+                    steps=[],
+                    method='analytical',
+                    visualization_data={
+                        'range': float(row.range),
+                        'time_flight': float(row.time_flight),
+                        'max_height': float(row.max_height),
+                        'final_velocity': float(row.final_velocity)
+                    }
+                )
+
+        collision_idx = [i for i, p in enumerate(problems)
+                         if p.problem_type == ProblemType.COLLISION and len(p.objects) >= 2]
+        if len(collision_idx) >= 2:
+            mass_a = np.array([problems[i].objects[0].mass for i in collision_idx], dtype=np.float64)
+            mass_b = np.array([problems[i].objects[1].mass for i in collision_idx], dtype=np.float64)
+            velocity_a = np.array([problems[i].objects[0].velocity for i in collision_idx], dtype=np.float64)
+            velocity_b = np.array([problems[i].objects[1].velocity for i in collision_idx], dtype=np.float64)
+            batch = self._solve_collision_batch(mass_a, mass_b, velocity_a, velocity_b)
+
+            for j, i in enumerate(collision_idx):
+                va_f = float(batch.velocity_a_final[j])
+                vb_f = float(batch.velocity_b_final[j])
+                solutions[i] = Solution(
+                    answer=[va_f, vb_f],
+                    unit='m/s',
+                    steps=[],
+                    method='analytical',
+                    visualization_data={'velocity_a_final': va_f, 'velocity_b_final': vb_f}
+                )
+
+        for i, problem in enumerate(problems):
+            if solutions[i] is None:
+                solutions[i] = self.solve_problem(problem)
+        return solutions
+
+    @staticmethod
+    def _solve_collision_batch(mass_a: np.ndarray, mass_b: np.ndarray,
+                               velocity_a: np.ndarray, velocity_b: np.ndarray) -> np.recarray:
+        """Vectorized elastic collision over arrays of (ma, mb, va, vb)"""
+        inv_total = 1.0 / (mass_a + mass_b)
+        velocity_a_final = ((mass_a - mass_b) * velocity_a + 2.0 * mass_b * velocity_b) * inv_total
+        velocity_b_final = ((mass_b - mass_a) * velocity_b + 2.0 * mass_a * velocity_a) * inv_total
+        return np.rec.fromarrays(
+            [velocity_a_final, velocity_b_final],
+            names=['velocity_a_final', 'velocity_b_final']
+        )
+
+    @staticmethod
+    def _solve_projectile_motion_batch(v0: np.ndarray, angle: np.ndarray, h: np.ndarray) -> np.recarray:
+        """Vectorized projectile solve over arrays of (v0, angle, h)"""
+        g = Config.GRAVITY
+        angle_rad = np.deg2rad(angle)
+        v0x = v0 * np.cos(angle_rad)
+        v0y = v0 * np.sin(angle_rad)
+
+        # Closed-form time of flight: t = (v0y + sqrt(v0y^2 + 2gh)) / g
+        disc = v0y * v0y + 2.0 * g * h
+        time_flight = (v0y + np.sqrt(disc)) / g
+
+        range_x = v0x * time_flight
+        max_height = h + v0y * v0y / (2.0 * g)
+        final_velocity = np.hypot(v0x, v0y - g * time_flight)
+
+        return np.rec.fromarrays(
+            [range_x, time_flight, max_height, final_velocity],
+            names=['range', 'time_flight', 'max_height', 'final_velocity']
+        )
+
     def _solve_kinematics(self, problem: PhysicsProblem) -> Solution:
         """Solve kinematics problems"""
         
@@ -121,72 +261,36 @@ class PhysicsSolver:
     def _solve_projectile_motion(self, initial_velocity: float, angle: float, height: float = 0) -> dict:
         """Solve projectile motion problem"""
         try:
-            print(f"Debug PhysicsMath: v0={initial_velocity}, angle={angle}, height={height}")
-            
-            # Convert angle to radians
-            angle_rad = math.radians(angle)
-            
-            # Calculate initial velocities
-            v0x = initial_velocity * math.cos(angle_rad)
-            v0y = initial_velocity * math.sin(angle_rad)
-            print(f"Debug PhysicsMath: v0x={v0x}, v0y={v0y}")
-            
-            # Calculate time of flight
-            # Using quadratic formula: h = h0 + v0y*t - 0.5*g*t^2
-            # When h = 0: 0 = h0 + v0y*t - 0.5*g*t^2
-            a = 0.5 * Config.GRAVITY  # Note: positive a since we're solving for h = 0
-            b = -v0y  # Note: negative b since we're solving for h = 0
-            c = -height  # Note: negative c since we're solving for h = 0
-            
-            discriminant = b**2 - 4*a*c
-            print(f"Debug PhysicsMath: discriminant={discriminant}")
-            
-            if discriminant < 0:
-                raise ValueError("No real solution for time of flight")
-            
-            # Use the positive root for time of flight
-            time_flight = (-b + math.sqrt(discriminant)) / (2*a)
-            if time_flight < 0:
-                time_flight = (-b - math.sqrt(discriminant)) / (2*a)
-            
-            print(f"Debug PhysicsMath: time_flight={time_flight}")
-            
-            # Calculate range
-            range_x = v0x * time_flight
-            print(f"Debug PhysicsMath: range_x={range_x}")
-            
-            # Calculate maximum height
-            # Time to reach max height: t = v0y/g
-            time_to_max = v0y / Config.GRAVITY
-            max_height = height + v0y * time_to_max - 0.5 * Config.GRAVITY * time_to_max**2
-            
-            # Calculate final velocity
-            final_velocity_x = v0x
-            final_velocity_y = v0y - Config.GRAVITY * time_flight
-            final_velocity = math.sqrt(final_velocity_x**2 + final_velocity_y**2)
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsMath: v0={initial_velocity}, angle={angle}, height={height}")
+
+            core = _projectile_core(_quantize(initial_velocity), _quantize(angle), _quantize(height))
+
             result = {
-                'range': range_x,
-                'time_flight': time_flight,
-                'max_height': max_height,
-                'final_velocity': final_velocity,
-                'final_velocity_x': final_velocity_x,
-                'final_velocity_y': final_velocity_y,
+                'range': core.range,
+                'time_flight': core.time_flight,
+                'max_height': core.max_height,
+                'final_velocity': core.final_velocity,
+                'final_velocity_x': core.final_velocity_x,
+                'final_velocity_y': core.final_velocity_y,
                 'initial_velocity': initial_velocity,
                 'angle': angle,
                 'height': height
             }
-            
-            print(f"Debug PhysicsMath: final result={result}")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsMath: final result={result}")
             return result
-            
+
         except Exception as e:
-            print(f"Debug PhysicsMath: Error in projectile calculation - {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsMath: Error in projectile calculation - {str(e)}")
             return {'error': str(e)}
     
     def _solve_free_fall(self, problem: PhysicsProblem) -> Dict[str, Any]:
         """Solve free fall problem"""
-        print("Debug PhysicsSolver: Solving free_fall problem")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Debug PhysicsSolver: Solving free_fall problem")
         
         # Get parameters
         height = problem.initial_conditions.get('height', 0)
@@ -194,42 +298,35 @@ class PhysicsSolver:
         time = problem.initial_conditions.get('time', 0)
         quantity_asked = problem.initial_conditions.get('quantity_asked', 'final_velocity')
         
-        print(f"Debug PhysicsSolver: Parameters - height={height}, initial_velocity={initial_velocity}, time={time}, quantity_asked={quantity_asked}")
-        
-        g = 9.81  # m/s^2
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Debug PhysicsSolver: Parameters - height={height}, initial_velocity={initial_velocity}, time={time}, quantity_asked={quantity_asked}")
         
         try:
+            core = _free_fall_core(_quantize(height), _quantize(time))
             if time > 0:
-                # Time-based calculation
-                distance = 0.5 * g * time * time
-                final_velocity = g * time
-                result = {
-                    'distance': distance,
-                    'final_velocity': final_velocity,
-                    'time_fall': time,
-                    'initial_velocity': initial_velocity,
-                    'answer': distance if quantity_asked == 'distance' else final_velocity,
-                    'unit': 'm' if quantity_asked == 'distance' else 'm/s'
-                }
+                answer = core.distance if quantity_asked == 'distance' else core.final_velocity
+                unit = 'm' if quantity_asked == 'distance' else 'm/s'
             else:
-                # Height-based calculation
-                final_velocity = math.sqrt(2 * g * height)
-                time_fall = math.sqrt(2 * height / g)
-                result = {
-                    'distance': height,
-                    'final_velocity': final_velocity,
-                    'time_fall': time_fall,
-                    'initial_velocity': initial_velocity,
-                    'answer': final_velocity if quantity_asked == 'final_velocity' else height,
-                    'unit': 'm/s' if quantity_asked == 'final_velocity' else 'm'
-                }
-            
-            print(f"Debug PhysicsSolver: result={result}")
-            print(f"Debug PhysicsSolver: answer={result['answer']}, unit={result['unit']}")
+                answer = core.final_velocity if quantity_asked == 'final_velocity' else core.distance
+                unit = 'm/s' if quantity_asked == 'final_velocity' else 'm'
+            result = {
+                'distance': core.distance,
+                'final_velocity': core.final_velocity,
+                'time_fall': core.time_fall,
+                'initial_velocity': initial_velocity,
+                'answer': answer,
+                'unit': unit
+            }
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: result={result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: answer={result['answer']}, unit={result['unit']}")
             return result
             
         except Exception as e:
-            print(f"Debug PhysicsSolver: Error in free fall calculation - {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: Error in free fall calculation - {str(e)}")
             return {'error': str(e)}
     
     def _solve_general_kinematics(self, problem: PhysicsProblem) -> Solution:
@@ -308,32 +405,19 @@ class PhysicsSolver:
     def _solve_pendulum(self, length: float, initial_angle: float = 30) -> dict:
         """Solve pendulum problem"""
         try:
-            if length <= 0:
-                raise ValueError("Pendulum length must be a positive value.")
+            core = _pendulum_core(_quantize(length), _quantize(initial_angle))
 
-            # Using small angle approximation
-            # T = 2π√(L/g)
-            period = 2 * math.pi * math.sqrt(length / Config.GRAVITY)
-            
-            # Calculate maximum velocity
-            # Using conservation of energy: mgh = 0.5mv^2
-            # h = L(1 - cos(θ))
-            height = length * (1 - math.cos(math.radians(initial_angle)))
-            max_velocity = math.sqrt(2 * Config.GRAVITY * height)
-            
-            # Calculate frequency
-            frequency = 1 / period if period > 0 else 0
-            
             return {
-                'period': period,
-                'max_velocity': max_velocity,
-                'frequency': frequency,
+                'period': core.period,
+                'max_velocity': core.max_velocity,
+                'frequency': core.frequency,
                 'length': length,
                 'initial_angle': initial_angle
             }
             
         except Exception as e:
-            print(f"Debug PhysicsMath: Error in pendulum calculation - {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsMath: Error in pendulum calculation - {str(e)}")
             raise e
     
     def _solve_general(self, problem: PhysicsProblem) -> Solution:
@@ -348,29 +432,21 @@ class PhysicsSolver:
     def _solve_collision(self, mass_a: float, mass_b: float, velocity_a: float, velocity_b: float = 0) -> dict:
         """Solve elastic collision problem"""
         try:
-            # Handle velocity_a if it's a list
-            if isinstance(velocity_a, list):
+            # Handle velocity if it's a vector
+            if isinstance(velocity_a, (list, np.ndarray)):
                 velocity_a = velocity_a[0]
-            if isinstance(velocity_b, list):
+            if isinstance(velocity_b, (list, np.ndarray)):
                 velocity_b = velocity_b[0]
             
-            # Check for zero mass to avoid division by zero
-            if mass_a <= 0 or mass_b <= 0:
-                raise ValueError("Mass must be greater than zero")
-            
-            # Using conservation of momentum and energy for elastic collisions
-            # v1f = ((m1-m2)v1i + 2m2v2i)/(m1+m2)
-            # v2f = ((m2-m1)v2i + 2m1v1i)/(m1+m2)
-            
-            total_mass = mass_a + mass_b
-            if total_mass <= 0:
-                raise ValueError("Total mass must be greater than zero")
+            core = _collision_core(_quantize(mass_a), _quantize(mass_b),
+                                   _quantize(velocity_a), _quantize(velocity_b))
+            velocity_a_final = core.velocity_a_final
+            velocity_b_final = core.velocity_b_final
             
-            velocity_a_final = ((mass_a - mass_b) * velocity_a + 2 * mass_b * velocity_b) / total_mass
-            velocity_b_final = ((mass_b - mass_a) * velocity_b + 2 * mass_a * velocity_a) / total_mass
-            
-            print(f"Debug: Collision calculation - mass_a={mass_a}, mass_b={mass_b}, v_a={velocity_a}, v_b={velocity_b}")
-            print(f"Debug: Results - v_a_final={velocity_a_final}, v_b_final={velocity_b_final}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug: Collision calculation - mass_a={mass_a}, mass_b={mass_b}, v_a={velocity_a}, v_b={velocity_b}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug: Results - v_a_final={velocity_a_final}, v_b_final={velocity_b_final}")
             
             # Format the steps without using f-strings with lists
             steps = [
@@ -393,7 +469,8 @@ class PhysicsSolver:
             }
             
         except Exception as e:
-            print(f"Debug PhysicsMath: Error in collision calculation - {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsMath: Error in collision calculation - {str(e)}")
             raise ValueError(f"Error in collision calculation: {str(e)}")
 
     def _generate_solution_steps(self, problem: PhysicsProblem, result: Dict[str, Any]) -> List[str]:
@@ -437,11 +514,11 @@ class PhysicsSolver:
             problem_text = f"""
             Problem Type: {problem.problem_type.value}
             Initial Conditions: {problem.initial_conditions}
-            Objects: {[obj.__dict__ for obj in problem.objects]}
+            Objects: {[dataclasses.asdict(obj) for obj in problem.objects]}
             Question: {problem.question}
             """
             
-            response = openai.ChatCompletion.create(
+            response = self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": """You are a physics problem solver. Your task is to:
@@ -474,5 +551,33 @@ Example output:
             )
             return json.loads(response.choices[0].message.content)
         except Exception as e:
-            print(f"Debug PhysicsSolver: Error in LLM solution - {str(e)}")
-            return None
\ No newline at end of file
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Debug PhysicsSolver: Error in LLM solution - {str(e)}")
+            return None
+
+    # Dispatch tables (class-level so they're built once): problem type ->
+    # solver entry point, and (problem type, quantity asked) -> result key
+    # and unit for the final answer
+    _SOLVERS = {
+        ProblemType.PROJECTILE: _dispatch_projectile,
+        ProblemType.FREE_FALL: _solve_free_fall,
+        ProblemType.PENDULUM: _dispatch_pendulum,
+        ProblemType.COLLISION: _dispatch_collision,
+    }
+
+    _ANSWER_MAP = {
+        (ProblemType.PROJECTILE, 'range'): ('range', 'm'),
+        (ProblemType.PROJECTILE, 'max_height'): ('max_height', 'm'),
+        (ProblemType.PROJECTILE, 'time_flight'): ('time_flight', 's'),
+        (ProblemType.FREE_FALL, 'final_velocity'): ('final_velocity', 'm/s'),
+        (ProblemType.FREE_FALL, 'distance'): ('distance', 'm'),
+        (ProblemType.FREE_FALL, 'time_fall'): ('time_fall', 's'),
+        (ProblemType.PENDULUM, 'period'): ('period', 's'),
+        (ProblemType.PENDULUM, 'max_velocity'): ('max_velocity', 'm/s'),
+    }
+
+    _DEFAULT_QUANTITY = {
+        ProblemType.PROJECTILE: 'range',
+        ProblemType.FREE_FALL: 'final_velocity',
+        ProblemType.PENDULUM: 'period',
+    }
\ No newline at end of file
@@ -1,15 +1,33 @@
 # core/problem_parser.py
 import json
 import re
+import time
+import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
-from openai import OpenAI
+from core.llm_client import get_openai_client
 from config.settings import Config
 from utils.data_models import PhysicsProblem, PhysicsObject, ProblemType, InputType
 
+logger = logging.getLogger(__name__)
+
+_WS_RE = re.compile(r'\s+')
+# Compiled once: re.findall would re-probe (and under threads, contend on)
+# the bounded re._cache on every call
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
 class ProblemParser:
     def __init__(self):
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
-        
+        # Memo over normalized problem text: re-parsing a previously seen
+        # problem (demo reruns, LLM retry loops) is a dict lookup instead
+        # of another chat-completion round-trip
+        self._llm_understand_cached = lru_cache(maxsize=1024)(self._llm_understand_uncached)
+
+    @property
+    def client(self):
+        # Lazy shared client: no TLS/pool setup unless the LLM path runs
+        return get_openai_client()
+
     def parse_text_problem(self, text: str) -> PhysicsProblem:
         """Parse any natural language physics problem into a structured PhysicsProblem"""
         try:
@@ -27,8 +45,30 @@ class ProblemParser:
 
     def _get_llm_understanding(self, text: str) -> dict:
         """Use LLM to intelligently understand and structure any physics problem"""
-        try:
-            response = self.client.chat.completions.create(
+        normalized = _WS_RE.sub(' ', text.strip().lower())
+        # json_object mode makes unparseable output rare; one backed-off
+        # retry (bypassing the memo so the bad string isn't reused) covers
+        # the residue instead of relying on prompt discipline
+        for attempt in range(2):
+            try:
+                if attempt == 0:
+                    raw = self._llm_understand_cached(normalized)
+                else:
+                    time.sleep(0.5)
+                    raw = self._llm_understand_uncached(normalized)
+                result = json.loads(raw)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[DEBUG] LLM parsed problem: {result}")
+                return result
+
+            except Exception as e:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[DEBUG] LLM parsing failed: {str(e)}")
+        return None
+
+    def _llm_understand_uncached(self, text: str) -> str:
+        """Raw chat-completion call; returns the JSON string for the memo layer"""
+        response = self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": """You are an expert physics problem analyzer. Your task is to understand ANY physics problem written in natural language and extract all relevant information.
@@ -164,16 +204,16 @@ Output: {
 }"""},
                     {"role": "user", "content": f"Analyze this physics problem: {text}"}
                 ],
-                temperature=0.1  # Low temperature for consistent parsing
+                # Grammar-constrained decoding guarantees parseable JSON;
+                # temperature 0 + fixed seed keep outputs deterministic so
+                # the memo layer hits on repeats
+                response_format={"type": "json_object"},
+                temperature=0,
+                seed=42,
+                max_tokens=400
             )
-            
-            result = json.loads(response.choices[0].message.content)
-            print(f"[DEBUG] LLM parsed problem: {result}")
-            return result
-            
-        except Exception as e:
-            print(f"[DEBUG] LLM parsing failed: {str(e)}")
-            return None
+
+        return response.choices[0].message.content
 
     def _create_problem_from_llm(self, structured_problem: Dict[str, Any], original_text: str) -> PhysicsProblem:
         """Create a PhysicsProblem from LLM's structured output"""
@@ -222,7 +262,8 @@ Output: {
                 physics_obj = PhysicsObject(**physics_obj_params)
                 objects.append(physics_obj)
             except Exception as e:
-                print(f"[DEBUG] Error creating object {obj}: {str(e)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[DEBUG] Error creating object {obj}: {str(e)}")
                 continue
         return objects
 
@@ -244,12 +285,12 @@ Output: {
         mapped_type = type_mapping.get(llm_type.upper())
         if not mapped_type:
             # Default to projectile motion for unknown types
-            print(f"[DEBUG] Unknown problem type '{llm_type}', defaulting to PROJECTILE")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[DEBUG] Unknown problem type '{llm_type}', defaulting to PROJECTILE")
             return ProblemType.PROJECTILE
             
         return mapped_type
 
     def _extract_numbers(self, text: str) -> List[float]:
         """Extract all numbers from text (utility function)"""
-        numbers = re.findall(r'\d+(?:\.\d+)?', text)
-        return [float(num) for num in numbers]
\ No newline at end of file
+        return list(map(float, _NUMBER_RE.findall(text)))
\ No newline at end of file
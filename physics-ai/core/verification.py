@@ -1,31 +1,166 @@
 # core/verification.py
+import re
+import logging
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from utils.data_models import PhysicsProblem, Solution, VerificationResult
 from core.simulation_engine import SimulationEngine
 from config.settings import Config
 from utils.data_models import ProblemType
+from utils.physics_math import PhysicsMath
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import; search() stops at the first number instead of
+# scanning the whole string like findall
+_NUM_RE = re.compile(r'-?\d+\.?\d*')
+# Signed decimals in collision answer strings ("Ball A: -1.50 m/s, ...")
+_COLL_RE = re.compile(r'[-+]?\d*\.?\d+')
+
+# Per-type verification spec: (sim result keys, display unit, is_vector).
+# One dict probe replaces the if/elif chain over ProblemType; FREE_FALL
+# refines its spec by the quantity asked.
+_VERIFY_SPEC = {
+    ProblemType.PROJECTILE: (('range',), 'm', False),
+    ProblemType.FREE_FALL: (('distance',), 'm', False),
+    ProblemType.PENDULUM: (('period',), 's', False),
+    ProblemType.COLLISION: (('velocity_a_final', 'velocity_b_final'), 'm/s', True),
+}
+_FREE_FALL_SPEC = {
+    'final_velocity': (('final_velocity',), 'm/s', False),
+}
 
 class VerificationEngine:
     def __init__(self, simulation_engine: SimulationEngine = None):
         self.simulation_engine = simulation_engine if simulation_engine else SimulationEngine()
         self.agreement_threshold = 0.1  # 10% difference threshold
+        # Per-type spec resolvers, built once: types whose comparison
+        # fields depend on the problem (free fall keys on the quantity
+        # asked) get a bound method; everything else resolves straight
+        # from the table with no per-call enum comparisons
+        self._spec_resolvers = {
+            ProblemType.FREE_FALL: self._free_fall_spec,
+        }
+
+    def _free_fall_spec(self, problem: PhysicsProblem) -> tuple:
+        return _FREE_FALL_SPEC.get(
+            problem.initial_conditions.get('quantity_asked'),
+            _VERIFY_SPEC[ProblemType.FREE_FALL])
         
+    @staticmethod
+    def _agreement_vec(analytical: np.ndarray, simulated: np.ndarray) -> np.ndarray:
+        """Branchless agreement score, element-wise over arrays.
+
+        Relative difference against the larger magnitude, clamped to
+        [0, 1]; the 0/0 pair scores 1.0 (both agree the value is zero)
+        and a single zero scores 0.0, matching the old scalar branches.
+        """
+        analytical = np.asarray(analytical, dtype=np.float64)
+        simulated = np.asarray(simulated, dtype=np.float64)
+        denom = np.maximum(np.abs(analytical), np.abs(simulated))
+        safe = np.where(denom == 0, 1.0, denom)
+        return np.where(denom == 0, 1.0,
+                        np.maximum(0.0, 1.0 - np.abs(analytical - simulated) / safe))
+
     def _calculate_agreement_score(self, analytical: float, simulated: float) -> float:
         """Calculate how well the analytical and simulated results agree"""
-        if analytical == 0 and simulated == 0:
-            return 1.0
-        if analytical == 0 or simulated == 0:
-            return 0.0
-            
-        # Calculate relative difference
-        relative_diff = abs(analytical - simulated) / max(abs(analytical), abs(simulated))
-        # Convert to agreement score (1.0 = perfect agreement, 0.0 = completely different)
-        return max(0.0, 1.0 - relative_diff)
+        return float(self._agreement_vec(analytical, simulated))
         
+    def verify_solution_batch(self, pairs: List[Tuple[PhysicsProblem, Solution]]) -> List[VerificationResult]:
+        """Verify many solutions at once.
+
+        Projectile problems are solved in one SoA pass through
+        PhysicsMath.projectile_motion_batch and scored with vectorized
+        NumPy; everything else falls back to the scalar path.
+        """
+        results: List[VerificationResult] = [None] * len(pairs)
+
+        projectile_idx = [i for i, (p, _) in enumerate(pairs)
+                          if p.problem_type == ProblemType.PROJECTILE]
+        if len(projectile_idx) >= 2:
+            v0 = np.array([pairs[i][0].initial_conditions.get('initial_velocity', 0)
+                           for i in projectile_idx], dtype=np.float64)
+            angle = np.array([pairs[i][0].initial_conditions.get('angle', 45)
+                              for i in projectile_idx], dtype=np.float64)
+            height = np.array([pairs[i][0].initial_conditions.get('height', 0)
+                               for i in projectile_idx], dtype=np.float64)
+            simulated = PhysicsMath.projectile_motion_batch(v0, angle, height)['range']
+            analytical = np.array([
+                self._extract_numerical_value(pairs[i][1].answer) or 0.0
+                for i in projectile_idx], dtype=np.float64)
+
+            scores = self._agreement_vec(analytical, simulated)
+            confidences = self._calc_confidence_vec(scores)
+
+            for j, i in enumerate(projectile_idx):
+                score = float(scores[j])
+                results[i] = VerificationResult(
+                    is_valid=score > 0.8,
+                    confidence=float(confidences[j]),
+                    error=None,
+                    analytical_result=pairs[i][1].answer,
+                    simulation_result=f"{simulated[j]:.2f} m",
+                    agreement_score=score
+                )
+
+        collision_idx = [i for i, (p, _) in enumerate(pairs)
+                         if p.problem_type == ProblemType.COLLISION
+                         and len(p.objects) >= 2 and results[i] is None]
+        if len(collision_idx) >= 2:
+            # SoA over the first two objects of each problem: one ufunc
+            # pass solves every collision in the group
+            batches = [pairs[i][0].to_soa() for i in collision_idx]
+            m1 = np.array([b.mass[0] for b in batches])
+            m2 = np.array([b.mass[1] for b in batches])
+            v1 = np.array([b.velocity[0] for b in batches])
+            v2 = np.array([b.velocity[1] for b in batches])
+            v1f, v2f = PhysicsMath.collision_1d_batch(m1, v1, m2, v2)
+
+            pair_scores = np.empty(len(collision_idx))
+            for j, i in enumerate(collision_idx):
+                solution = pairs[i][1]
+                analytical = solution.answer if isinstance(solution.answer, list) else [
+                    self._extract_numerical_value(str(solution.answer)) or 0.0] * 2
+                simulated = np.array([v1f[j], v2f[j]])
+                pair_scores[j] = self._agreement_vec(
+                    np.asarray(analytical, dtype=np.float64), simulated).mean()
+            confidences = self._calc_confidence_vec(pair_scores)
+
+            for j, i in enumerate(collision_idx):
+                solution = pairs[i][1]
+                score = float(pair_scores[j])
+                results[i] = VerificationResult(
+                    is_valid=score > 0.8,
+                    confidence=float(confidences[j]),
+                    error=None,
+                    analytical_result=solution.answer,
+                    simulation_result=(f"Final velocities: Ball A = {v1f[j]:.2f} m/s, "
+                                       f"Ball B = {v2f[j]:.2f} m/s"),
+                    agreement_score=score
+                )
+
+        for i, (problem, solution) in enumerate(pairs):
+            if results[i] is None:
+                results[i] = self.verify_solution(problem, solution)
+        return results
+
     def verify_solution(self, problem: PhysicsProblem, solution: Solution) -> VerificationResult:
         """Verify a solution using simulation"""
         try:
+            # Resolve the comparison spec first: an unsupported type
+            # returns immediately instead of running (and discarding) a
+            # full simulation
+            resolver = self._spec_resolvers.get(problem.problem_type)
+            spec = resolver(problem) if resolver else _VERIFY_SPEC.get(problem.problem_type)
+            if spec is None:
+                return VerificationResult(
+                    is_valid=False,
+                    confidence=0.0,
+                    error="Problem type not supported for verification",
+                    simulation_result="Unsupported problem type"
+                )
+            keys, unit, is_vector = spec
+            
             # Get simulation result
             sim_result = self.simulation_engine.simulate(problem)
             
@@ -37,51 +172,28 @@ class VerificationEngine:
                     simulation_result="Simulation failed"
                 )
             
-            # Compare results based on problem type
-            if problem.problem_type == ProblemType.PROJECTILE:
-                analytical = solution.answer
-                simulated = sim_result.get('range', 0)
-                unit = 'm'
-                
-            elif problem.problem_type == ProblemType.FREE_FALL:
-                if problem.initial_conditions.get('quantity_asked') == 'final_velocity':
-                    analytical = solution.answer
-                    simulated = sim_result.get('final_velocity', 0)
-                    unit = 'm/s'
-                else:  # distance
-                    analytical = solution.answer
-                    simulated = sim_result.get('distance', 0)
-                    unit = 'm'
-                    
-            elif problem.problem_type == ProblemType.PENDULUM:
-                analytical = solution.answer
-                simulated = sim_result.get('period', 0)
-                unit = 's'
-                
-            elif problem.problem_type == ProblemType.COLLISION:
-                # For collisions, we compare both final velocities
-                analytical = solution.answer  # This is a list [v_a_final, v_b_final]
-                simulated = [sim_result.get('velocity_a_final', 0), sim_result.get('velocity_b_final', 0)]
-                unit = 'm/s'
-                
+            # For collisions the answer is a list [v_a_final, v_b_final].
+            # The simulation engine always sets the spec'd keys for
+            # supported types, so index directly and bind once — an
+            # unexpected error dict surfaces via the except below instead
+            # of silently comparing against 0.
+            analytical = solution.answer
+            if is_vector:
+                simulated = [sim_result[key] for key in keys]
             else:
-                return VerificationResult(
-                    is_valid=False,
-                    confidence=0.0,
-                    error="Problem type not supported for verification",
-                    simulation_result="Unsupported problem type"
-                )
+                simulated = sim_result[keys[0]]
             
             # Calculate agreement score
             if isinstance(analytical, list) and isinstance(simulated, list):
-                # For collision problems, compare both velocities
-                agreement_score = self._calculate_agreement_score(analytical[0], simulated[0]) * 0.5 + \
-                                self._calculate_agreement_score(analytical[1], simulated[1]) * 0.5
+                # For collision problems, score both velocities in one
+                # vectorized pass and average
+                agreement_score = float(self._agreement_vec(
+                    np.asarray(analytical), np.asarray(simulated)).mean())
             else:
                 agreement_score = self._calculate_agreement_score(analytical, simulated)
             
             # Format simulation result for display
-            if problem.problem_type == ProblemType.COLLISION:
+            if is_vector:
                 sim_display = f"Final velocities: Ball A = {simulated[0]:.2f} m/s, Ball B = {simulated[1]:.2f} m/s"
             else:
                 sim_display = f"{simulated:.2f} {unit}"
@@ -102,7 +214,7 @@ class VerificationEngine:
             )
             
         except Exception as e:
-            print(f"Error in verification: {str(e)}")
+            logger.error("Error in verification: %s", e)
             return VerificationResult(
                 is_valid=False,
                 confidence=0.0,
@@ -118,48 +230,39 @@ class VerificationEngine:
         angle = problem.initial_conditions.get('angle', 45)
         height = problem.initial_conditions.get('height', 0)
         
-        print(f"Debug Verification: v0={initial_velocity}, angle={angle}, height={height}")
-        
-        # Run simulation
-        sim_result = self.simulation_engine.verify_projectile_motion(
-            initial_velocity=initial_velocity,
-            angle=angle,
-            height=height
-        )
-        print(f"Debug Verification: sim_result={sim_result}")
-        
-        # Check for simulation errors
-        if 'error' in sim_result:
-            print(f"Debug Verification: Simulation error: {sim_result['error']}")
+        logger.debug("Verification inputs: v0=%s, angle=%s, height=%s",
+                     initial_velocity, angle, height)
+
+        # This path only ever compares range, so the range-only helper
+        # skips the apex and final-velocity math of the full solve
+        try:
+            sim_value, _ = PhysicsMath.projectile_range_only(
+                initial_velocity, angle, height)
+        except ValueError as e:
+            logger.debug("Range computation error: %s", e)
             return VerificationResult(
                 is_valid=False,
                 confidence=0.0,
-                error=f"Simulation failed: {sim_result['error']}",
+                error=f"Range computation failed: {e}",
                 analytical_result=solution.answer,
-                simulation_result=f"Simulation failed: {sim_result['error']}"
+                simulation_result=f"Range computation failed: {e}"
             )
-        
+        logger.debug("Verification range=%s", sim_value)
+
         # Extract analytical value
         analytical_value = float(solution.answer.split()[0])  # Extract number from "X meters"
-        print(f"Debug Verification: analytical_value={analytical_value}")
-        
-        # For projectile motion, we always compare range
-        sim_value = sim_result['range']
-        comparison_type = "range"
-        
-        print(f"Debug Verification: sim_value={sim_value}, comparison_type={comparison_type}")
-        
+
+
         # Calculate agreement score
         if analytical_value != 0:
             agreement_score = 1.0 - min(abs(sim_value - analytical_value) / analytical_value, 1.0)
         else:
             agreement_score = 1.0 if sim_value == 0 else 0.0
         
-        print(f"Debug Verification: agreement_score={agreement_score}")
+        logger.debug("agreement_score=%s", agreement_score)
         
         # Calculate confidence based on agreement score
         confidence = agreement_score
-        print(f"Debug Verification: confidence={confidence}")
         
         # Check if solution is valid (agreement > threshold)
         is_valid = agreement_score > 0.8
@@ -277,30 +380,23 @@ class VerificationEngine:
     
     def _extract_numerical_value(self, answer_string: str) -> float:
         """Extract numerical value from answer string"""
-        import re
-        
-        # Look for numbers in the string
-        numbers = re.findall(r'-?\d+\.?\d*', str(answer_string))
-        if numbers:
-            return float(numbers[0])
-        return None
+        m = _NUM_RE.search(str(answer_string))
+        return float(m.group()) if m else None
     
+    @staticmethod
+    def _calc_confidence_vec(scores: np.ndarray) -> np.ndarray:
+        """Tiered confidence rules from _calculate_confidence, branchless
+        over a batch of agreement scores"""
+        scores = np.asarray(scores, dtype=np.float64)
+        return np.select(
+            [scores >= Config.HIGH_CONFIDENCE_THRESHOLD,
+             scores >= Config.MEDIUM_CONFIDENCE_THRESHOLD],
+            [np.minimum(0.99, scores + 0.05), scores],
+            default=np.maximum(0.1, scores - 0.1))
+
     def _calculate_agreement(self, analytical: float, simulation: float) -> float:
         """Calculate agreement score between analytical and simulation results"""
-        
-        if analytical == 0 and simulation == 0:
-            return 1.0
-        
-        if analytical == 0 or simulation == 0:
-            return 0.0
-        
-        # Calculate relative error
-        relative_error = abs(analytical - simulation) / max(abs(analytical), abs(simulation))
-        
-        # Convert to agreement score (1.0 = perfect agreement)
-        agreement = max(0.0, 1.0 - relative_error)
-        
-        return agreement
+        return float(self._agreement_vec(analytical, simulation))
     
     def _calculate_confidence(self, agreement_score: float) -> float:
         """Calculate overall confidence based on agreement"""
@@ -342,11 +438,11 @@ class VerificationEngine:
             sim_velocity_a = simulation_result.get('velocity_a_final', 0)
             sim_velocity_b = simulation_result.get('velocity_b_final', 0)
 
-            # Extract final velocities from analytical solution
-            # Parse the answer string to get velocities
-            answer_parts = solution.answer.split(',')
-            analytical_velocity_a = float(answer_parts[0].split(':')[1].strip().split()[0])
-            analytical_velocity_b = float(answer_parts[1].split(':')[1].strip().split()[0])
+            # Extract final velocities from analytical solution: one
+            # C-level regex scan instead of a chain of split() allocations
+            nums = _COLL_RE.findall(solution.answer)
+            analytical_velocity_a = float(nums[0])
+            analytical_velocity_b = float(nums[1])
 
             # Calculate agreement scores for each ball
             agreement_a = 1.0 - min(abs(sim_velocity_a - analytical_velocity_a) / max(abs(analytical_velocity_a), 0.1), 1.0)
@@ -371,7 +467,7 @@ class VerificationEngine:
             )
 
         except Exception as e:
-            print(f"Error verifying collision: {str(e)}")
+            logger.error("Error verifying collision: %s", e)
             return VerificationResult(
                 is_valid=False,
                 confidence=0.0,
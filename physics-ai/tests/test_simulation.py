@@ -9,8 +9,11 @@ import numpy as np
 
 class TestSimulationEngine(unittest.TestCase):
     
-    def setUp(self):
-        self.sim_engine = SimulationEngine()
+    @classmethod
+    def setUpClass(cls):
+        # One engine for the whole class: constructing (and connecting)
+        # a fresh engine per test method dominated suite time
+        cls.sim_engine = SimulationEngine()
     
     def test_projectile_motion_simulation(self):
         """Test projectile motion simulation"""
@@ -10,9 +10,10 @@ from utils.data_models import PhysicsProblem, ProblemType, InputType
 
 class TestPhysicsSolver(unittest.TestCase):
     
-    def setUp(self):
-        self.solver = PhysicsSolver()
-        self.parser = ProblemParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.solver = PhysicsSolver()
+        cls.parser = ProblemParser()
     
     def test_free_fall_problem(self):
         """Test free fall calculation"""
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
+import numpy as np
+
 class ProblemType(Enum):
     """Types of physics problems that can be solved"""
     GENERAL = "general"
@@ -21,7 +23,7 @@ class InputType(Enum):
     IMAGE = "image"
     INTERACTIVE = "interactive"
 
-@dataclass
+@dataclass(slots=True)
 class PhysicsObject:
     """Represents a physical object in the problem"""
     name: str
@@ -34,16 +36,36 @@ class PhysicsObject:
     height: Optional[float] = None
     
     def __post_init__(self):
+        # Vector fields live in contiguous float64 buffers so NumPy and
+        # compiled kernels consume them without per-call conversion;
+        # scalar velocities from the parser pass through untouched
         if self.position is None:
-            self.position = [0.0, 0.0, 0.0]
+            self.position = np.zeros(3)
+        elif isinstance(self.position, (list, tuple)):
+            self.position = np.asarray(self.position, dtype=np.float64)
         if self.velocity is None:
-            self.velocity = [0.0, 0.0, 0.0]
+            self.velocity = np.zeros(3)
+        elif isinstance(self.velocity, (list, tuple)):
+            self.velocity = np.asarray(self.velocity, dtype=np.float64)
         if self.acceleration is None:
-            self.acceleration = [0.0, 0.0, 0.0]
+            self.acceleration = np.zeros(3)
+        elif isinstance(self.acceleration, (list, tuple)):
+            self.acceleration = np.asarray(self.acceleration, dtype=np.float64)
         if self.forces is None:
             self.forces = []
 
-@dataclass
+@dataclass(slots=True)
+class ObjectBatch:
+    """Structure-of-arrays view over a list of PhysicsObject.
+
+    Contiguous float64 columns that NumPy/compiled kernels can consume
+    directly, instead of fetching attributes object by object. velocity
+    holds the x-component (the 1D speed used by the collision paths).
+    """
+    mass: np.ndarray
+    velocity: np.ndarray
+
+@dataclass(slots=True)
 class PhysicsProblem:
     """Represents a physics problem to be solved"""
     problem_text: str
@@ -55,7 +77,17 @@ class PhysicsProblem:
     input_type: InputType = InputType.TEXT
     expected_answer_type: str = "unknown"
 
-@dataclass
+    def to_soa(self) -> ObjectBatch:
+        """Stack object fields into an ObjectBatch for batch kernels"""
+        return ObjectBatch(
+            mass=np.array([obj.mass for obj in self.objects], dtype=np.float64),
+            velocity=np.array([
+                obj.velocity[0] if isinstance(obj.velocity, (list, tuple, np.ndarray))
+                else (obj.velocity or 0.0)
+                for obj in self.objects], dtype=np.float64),
+        )
+
+@dataclass(slots=True)
 class Solution:
     """Represents a solution to a physics problem"""
     answer: float
@@ -67,7 +99,7 @@ class Solution:
     alternative_methods: Optional[List[str]] = None
     analytical_result: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of solution verification"""
     is_valid: bool
@@ -3,6 +3,13 @@ import sympy as sp
 from typing import Dict, List, Tuple, Any
 from config.settings import Config
 import math
+from core._kernels import (
+    projectile_kernel,
+    free_fall_time_kernel,
+    collision_restitution_kernel,
+    pendulum_elliptic_kernel,
+    pendulum_batch_kernel,
+)
 
 class PhysicsMath:
     @staticmethod
@@ -24,56 +31,17 @@ class PhysicsMath:
             - final_velocity_x: Final x-velocity (m/s)
             - final_velocity_y: Final y-velocity (m/s)
         """
-        print(f"Debug PhysicsMath: v0={v0}, angle={angle}, height={height}")
-        
-        # Convert angle to radians
-        angle_rad = math.radians(angle)
-        
-        # Calculate initial velocity components
-        v0x = v0 * math.cos(angle_rad)
-        v0y = v0 * math.sin(angle_rad)
-        print(f"Debug PhysicsMath: v0x={v0x:.2f}, v0y={v0y:.2f}")
-        
-        # Calculate time of flight using quadratic equation
-        # y = y0 + v0y*t - 0.5*g*t^2
-        # When y = 0 (ground level), solve for t
-        # 0 = height + v0y*t - 0.5*g*t^2
-        # 0.5*g*t^2 - v0y*t - height = 0
-        
-        a = 0.5 * Config.GRAVITY
-        b = -v0y
-        c = -height
-        
-        discriminant = b**2 - 4*a*c
-        print(f"Debug PhysicsMath: discriminant={discriminant}")
-        
-        if discriminant < 0:
+        # Thin wrapper over the compiled kernel: the scalar math (and the
+        # quadratic for time of flight) runs without interpreter dispatch
+        range_x, time_flight, max_height, final_velocity, final_velocity_x, final_velocity_y = \
+            projectile_kernel(v0, angle, height, Config.GRAVITY)
+
+        # fastmath turns the negative-discriminant sqrt into NaN rather
+        # than raising; keep the original contract
+        if math.isnan(time_flight):
             raise ValueError("Projectile will not reach the ground")
-        
-        # Use the positive root for time of flight
-        time_flight = (-b + math.sqrt(discriminant)) / (2*a)
-        print(f"Debug PhysicsMath: time_flight={time_flight:.2f}")
-        
-        # Calculate range
-        range_x = v0x * time_flight
-        print(f"Debug PhysicsMath: range_x={range_x:.2f}")
-        
-        # Calculate maximum height
-        # At max height, vy = 0
-        # vy = v0y - g*t
-        # 0 = v0y - g*t
-        # t = v0y/g
-        time_to_max_height = v0y / Config.GRAVITY
-        max_height = height + v0y * time_to_max_height - 0.5 * Config.GRAVITY * time_to_max_height**2
-        
-        # Calculate final velocity components
-        final_velocity_x = v0x  # No air resistance, so x-velocity remains constant
-        final_velocity_y = v0y - Config.GRAVITY * time_flight
-        
-        # Calculate final velocity magnitude
-        final_velocity = math.sqrt(final_velocity_x**2 + final_velocity_y**2)
-        
-        result = {
+
+        return {
             'range': range_x,
             'time_flight': time_flight,
             'max_height': max_height,
@@ -81,27 +49,57 @@ class PhysicsMath:
             'final_velocity_x': final_velocity_x,
             'final_velocity_y': final_velocity_y
         }
-        print(f"Debug PhysicsMath: final result={result}")
-        
-        return result
     
     @staticmethod
-    def free_fall(height: float, initial_velocity: float = 0) -> Dict[str, float]:
-        """Calculate free fall motion"""
+    def projectile_range_only(v0: float, angle: float, height: float = 0) -> Tuple[float, float]:
+        """Just (range, time_flight) — skips the apex and final-velocity
+        math for callers that only compare range (the verification path).
+        """
         g = Config.GRAVITY
-        
-        # Time to fall: h = v0*t + 0.5*g*t^2
-        # Rearranged: 0.5*g*t^2 + v0*t - h = 0
-        a, b, c = 0.5 * g, initial_velocity, -height
-        discriminant = b**2 - 4*a*c
-        
-        if discriminant >= 0:
-            time = (-b + np.sqrt(discriminant)) / (2*a)
+        angle_rad = math.radians(angle)
+        v0x = v0 * math.cos(angle_rad)
+        v0y = v0 * math.sin(angle_rad)
+        if height == 0.0 and v0y >= 0.0:
+            time_flight = 2.0 * v0y / g
         else:
-            time = 0
-        
-        # Final velocity: v = v0 + g*t
-        final_velocity = initial_velocity + g * time
+            time_flight = (v0y + math.sqrt(v0y * v0y + 2.0 * g * height)) / g
+        return v0x * time_flight, time_flight
+
+    @staticmethod
+    def projectile_motion_batch(v0: np.ndarray, angle_deg: np.ndarray,
+                                height: np.ndarray = None) -> Dict[str, np.ndarray]:
+        """Vectorized projectile motion over SoA arrays.
+
+        Solves N problems with one compiled ufunc pass per operation
+        instead of N scalar calls; returns the same fields as
+        projectile_motion but as float64 arrays.
+        """
+        g = Config.GRAVITY
+        v0 = np.asarray(v0, dtype=np.float64)
+        angle_rad = np.deg2rad(np.asarray(angle_deg, dtype=np.float64))
+        height = (np.zeros_like(v0) if height is None
+                  else np.asarray(height, dtype=np.float64))
+
+        v0x = v0 * np.cos(angle_rad)
+        v0y = v0 * np.sin(angle_rad)
+        disc = v0y * v0y + 2.0 * g * height
+        time_flight = (v0y + np.sqrt(disc)) / g
+        final_velocity_y = v0y - g * time_flight
+
+        return {
+            'range': v0x * time_flight,
+            'time_flight': time_flight,
+            'max_height': height + v0y * v0y / (2.0 * g),
+            'final_velocity': np.hypot(v0x, final_velocity_y),
+            'final_velocity_x': v0x,
+            'final_velocity_y': final_velocity_y
+        }
+
+    @staticmethod
+    def free_fall(height: float, initial_velocity: float = 0) -> Dict[str, float]:
+        """Calculate free fall motion"""
+        time, final_velocity = free_fall_time_kernel(
+            height, initial_velocity, Config.GRAVITY)
         
         return {
             'time': time,
@@ -115,36 +113,40 @@ class PhysicsMath:
         
         # Conservation of momentum: m1*v1 + m2*v2 = m1*v1f + m2*v2f
         # Coefficient of restitution: e = (v2f - v1f) / (v1 - v2)
-        
-        total_momentum = m1 * v1 + m2 * v2
-        relative_velocity = v1 - v2
-        
-        # Solve system of equations
-        v1f = (total_momentum - m2 * coefficient_restitution * relative_velocity) / (m1 + m2)
-        v2f = v1f + coefficient_restitution * relative_velocity
-        
-        return v1f, v2f
+        return collision_restitution_kernel(m1, v1, m2, v2, coefficient_restitution)
     
+    @staticmethod
+    def collision_1d_batch(m1: np.ndarray, v1: np.ndarray, m2: np.ndarray, v2: np.ndarray,
+                           coefficient_restitution: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized 1D collisions over SoA arrays: (v1_final, v2_final)"""
+        relative_velocity = v1 - v2
+        v1f = (m1 * v1 + m2 * v2 - m2 * coefficient_restitution * relative_velocity) / (m1 + m2)
+        return v1f, v1f + coefficient_restitution * relative_velocity
+
+    @staticmethod
+    def pendulum_motion_batch(length: np.ndarray, angle_max: np.ndarray) -> Dict[str, np.ndarray]:
+        """Vectorized pendulum sweep; thread-parallel over independent pendula"""
+        period, v_max = pendulum_batch_kernel(
+            np.ascontiguousarray(length, dtype=np.float64),
+            np.ascontiguousarray(angle_max, dtype=np.float64),
+            Config.GRAVITY)
+        return {
+            'period_accurate': period,
+            'max_velocity': v_max,
+            'frequency': 1.0 / period
+        }
+
     @staticmethod
     def pendulum_motion(length: float, angle_max: float) -> Dict[str, float]:
         """Calculate pendulum motion parameters"""
-        g = Config.GRAVITY
-        
-        # Small angle approximation period
-        period_small = 2 * np.pi * np.sqrt(length / g)
-        
-        # More accurate period for larger angles
-        angle_rad = np.radians(angle_max)
-        k = np.sin(angle_rad / 2)
-        # Elliptic integral approximation
-        period_accurate = period_small * (1 + 0.25 * k**2 + 0.0625 * k**4)
-        
-        # Maximum velocity (at bottom)
-        v_max = np.sqrt(2 * g * length * (1 - np.cos(angle_rad)))
+        if isinstance(length, np.ndarray):
+            return PhysicsMath.pendulum_motion_batch(length, angle_max)
+        period_small, period_accurate, v_max = pendulum_elliptic_kernel(
+            length, angle_max, Config.GRAVITY)
         
         return {
             'period_small_angle': period_small,
             'period_accurate': period_accurate,
             'max_velocity': v_max,
             'frequency': 1 / period_accurate
-        }
\ No newline at end of file
+        }
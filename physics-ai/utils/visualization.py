@@ -1,11 +1,204 @@
 # utils/visualization.py
-import matplotlib.pyplot as plt
+import math
+import pickle
+from collections import defaultdict
+from functools import lru_cache
+
+from core._kernels import sin_cos_scaled_kernel, trajectory_xy_kernel
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 import numpy as np
 from typing import Dict, List, Any, Optional
-import matplotlib.animation as animation
-from mpl_toolkits.mplot3d import Axes3D
+
+try:
+    # orjson walks numpy arrays natively and emits bytes directly, so
+    # figure serialization downstream (Dash/streamlit to_json) runs
+    # several times faster than with stdlib json
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Normalized sample grids, allocated once; call sites scale them
+# instead of paying a fresh np.linspace per figure
+_U100 = np.linspace(0.0, 1.0, 100)
+_U200 = np.linspace(0.0, 1.0, 200)
+# Two periods of normalized pendulum phase: cos(2*pi*t/T) over t in
+# [0, 2T] is the same curve for every pendulum
+_COS_PHASE_200 = np.cos(4.0 * np.pi * _U200)
+
+# Collision label templates, built once: .format on a precompiled
+# template skips re-parsing the f-string literals on every diagram
+_COLL_BEFORE_TMPL = 'm{i}={m}kg<br>v{i}={v}m/s'
+_COLL_AFTER_TMPL = "m{i}={m}kg<br>v{i}'={v:.1f}m/s"
+
+
+def _lttb(x, y, n_out: int = 2000):
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the ~n_out visually significant points of a long series so
+    figure construction, JSON payload and client render all scale with
+    the target size instead of the raw sample count. Short inputs pass
+    through untouched.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    buckets = np.array_split(np.arange(1, n - 1), n_out - 2)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0] = 0
+    idx[-1] = n - 1
+    anchor = 0
+    for k, bucket in enumerate(buckets):
+        if k + 1 < len(buckets):
+            nxt = buckets[k + 1]
+            avg_x = x[nxt].mean()
+            avg_y = y[nxt].mean()
+        else:
+            avg_x = x[-1]
+            avg_y = y[-1]
+        # Triangle area between the previous anchor, each candidate and
+        # the next bucket's centroid; keep the largest
+        area = np.abs((x[anchor] - avg_x) * (y[bucket] - y[anchor])
+                      - (x[anchor] - x[bucket]) * (avg_y - y[anchor]))
+        anchor = bucket[np.argmax(area)]
+        idx[k + 1] = anchor
+    return x[idx], y[idx]
+
+
+@lru_cache(maxsize=64)
+def _projectile_arrays(v0: float, angle: float, height: float, tf: float):
+    """Memoized (x, y) trajectory samples, returned read-only.
+
+    Dashboard refreshes revisualize identical parameter tuples; the hit
+    path is a dict lookup instead of regenerating the arrays. Callers
+    round the floats first to raise the hit rate.
+    """
+    t = _U100 * tf
+    x = np.empty_like(t)
+    y = np.empty_like(t)
+    trajectory_xy_kernel(v0, math.radians(angle), height, 9.81, t, x, y)
+    # Rendering only needs screen precision: float32 halves the bytes
+    # the JSON encoder and the browser have to move
+    x = x.astype(np.float32)
+    y = y.astype(np.float32)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
+@lru_cache(maxsize=64)
+def _pendulum_arrays(length: float, period: float, max_angle: float):
+    """Memoized (x, y) bob positions over two periods, returned read-only."""
+    # Radians end to end: converting the amplitude once replaces the
+    # per-sample np.radians passes
+    max_rad = math.radians(max_angle)
+    angles = max_rad * _COS_PHASE_200
+    # Compiled prange kernel: releases the GIL and spreads the trig over
+    # cores when several figures are built concurrently
+    x_positions = np.empty_like(angles)
+    y_positions = np.empty_like(angles)
+    sin_cos_scaled_kernel(angles, length, x_positions, y_positions)
+    np.negative(y_positions, out=y_positions)
+    x_positions = x_positions.astype(np.float32)
+    y_positions = y_positions.astype(np.float32)
+    x_positions.setflags(write=False)
+    y_positions.setflags(write=False)
+    return x_positions, y_positions
+
+
+@lru_cache(maxsize=32)
+def _ground_surface(max_x: float) -> bytes:
+    """Pickled ground-plane trace for a quantized trajectory extent.
+
+    Keyed on max_x rounded up to 10 m so nearby trajectories share one
+    validated trace; callers pickle.loads a private copy.
+    """
+    # Two flat-colored triangles over the four corners: unlike a
+    # Surface, Mesh3d skips the colorscale mapping entirely
+    half_width = max_x * 0.1
+    return pickle.dumps(go.Mesh3d(
+        x=[0.0, max_x, max_x, 0.0],
+        y=[-half_width, -half_width, half_width, half_width],
+        z=[0.0, 0.0, 0.0, 0.0],
+        i=[0, 0], j=[1, 2], k=[2, 3],
+        opacity=0.3,
+        color='lightgray',
+        name='Ground'
+    ))
+
+
+@lru_cache(maxsize=32)
+def _pendulum_skeleton(length: float, max_angle: float) -> bytes:
+    """Pickled static part of the pendulum figure (path, pivot, layout).
+
+    Everything here is invariant for a given length/max_angle, so the
+    plotly schema validation runs once per distinct pendulum instead of
+    on every animation build.
+    """
+    fig = go.Figure()
+
+    # Pendulum path (full arc), computed directly in radians
+    max_rad = math.radians(max_angle)
+    path_angles = np.linspace(-max_rad, max_rad, 100, dtype=np.float32)
+    path_x = length * np.sin(path_angles)
+    path_y = -length * np.cos(path_angles)
+
+    fig.add_trace(go.Scatter(
+        x=path_x, y=path_y,
+        mode='lines',
+        line=dict(color='lightgray', width=2, dash='dash'),
+        name='Pendulum Path',
+        showlegend=False
+    ))
+
+    # Pivot point
+    fig.add_trace(go.Scatter(
+        x=[0], y=[0],
+        mode='markers',
+        marker=dict(size=15, color='black', symbol='x'),
+        name='Pivot Point'
+    ))
+
+    fig.update_layout(
+        updatemenus=[{
+            'type': 'buttons',
+            'showactive': False,
+            'buttons': [
+                {
+                    'label': 'Play',
+                    'method': 'animate',
+                    'args': [None, {
+                        'frame': {'duration': 50, 'redraw': True},
+                        'fromcurrent': True,
+                        'mode': 'immediate'
+                    }]
+                },
+                {
+                    'label': 'Pause',
+                    'method': 'animate',
+                    'args': [[None], {
+                        'frame': {'duration': 0, 'redraw': False},
+                        'mode': 'immediate',
+                        'transition': {'duration': 0}
+                    }]
+                }
+            ]
+        }],
+        xaxis_title='Position (m)',
+        yaxis_title='Height (m)',
+        xaxis=dict(range=[-length*1.2, length*1.2], scaleanchor='y'),
+        yaxis=dict(range=[-length*1.2, length*0.2]),
+        width=600,
+        height=600,
+        showlegend=True
+    )
+    return pickle.dumps(fig)
+
 
 class PhysicsVisualizer:
     def __init__(self):
@@ -25,16 +218,14 @@ class PhysicsVisualizer:
             # Back-calculate from results
             range_val = result_data.get('range', 40)
             time_flight = result_data.get('time_flight', 4)
-            v0 = range_val / (time_flight * np.cos(np.radians(45)))
+            v0 = range_val / (time_flight * math.cos(math.radians(45)))
             angle = 45
             height = 0
         
-        # Generate trajectory points
-        t = np.linspace(0, result_data.get('time_flight', 4), 100)
-        
-        # Kinematic equations
-        x = v0 * np.cos(np.radians(angle)) * t
-        y = v0 * np.sin(np.radians(angle)) * t - 0.5 * 9.81 * t**2 + height
+        # Memoized trajectory samples (rounded keys so float noise
+        # doesn't defeat the cache); arrays come back read-only
+        x, y = _projectile_arrays(round(v0, 4), round(angle, 4), round(height, 4),
+                                  round(result_data.get('time_flight', 4), 4))
         
         # Create 3D trajectory
         fig = go.Figure()
@@ -64,8 +255,14 @@ class PhysicsVisualizer:
             name='Landing Point'
         ))
         
-        # Maximum height point
-        max_height_idx = np.argmax(y)
+        # Maximum height point: the apex time is analytic (v0y/g), so
+        # its index on the uniform grid is O(1) instead of an argmax scan
+        tf = result_data.get('time_flight', 4)
+        t_apex = v0 * math.sin(math.radians(angle)) / 9.81
+        if tf > 0:
+            max_height_idx = min(len(y) - 1, max(0, round(t_apex / tf * (len(y) - 1))))
+        else:
+            max_height_idx = 0
         fig.add_trace(go.Scatter3d(
             x=[x[max_height_idx]], y=[0], z=[y[max_height_idx]],
             mode='markers',
@@ -73,19 +270,9 @@ class PhysicsVisualizer:
             name='Max Height'
         ))
         
-        # Ground plane
-        ground_x = np.linspace(0, max(x), 10)
-        ground_y = np.linspace(-max(x)*0.1, max(x)*0.1, 10)
-        ground_X, ground_Y = np.meshgrid(ground_x, ground_y)
-        ground_Z = np.zeros_like(ground_X)
-        
-        fig.add_trace(go.Surface(
-            x=ground_X, y=ground_Y, z=ground_Z,
-            opacity=0.3,
-            colorscale='Greys',
-            showscale=False,
-            name='Ground'
-        ))
+        # Ground plane: cached per 10 m extent bucket, deep-copied via
+        # pickle so the shared skeleton is never mutated
+        fig.add_trace(pickle.loads(_ground_surface(10.0 * math.ceil(x[-1] / 10.0))))
         
         # Update layout
         fig.update_layout(
@@ -113,125 +300,49 @@ class PhysicsVisualizer:
         period = result_data.get('period_accurate', 2.0)
         max_angle = params.get('max_angle', 30) if params else 30
         
-        # Generate motion data
-        t = np.linspace(0, 2*period, 200)
-        angles = max_angle * np.cos(2 * np.pi * t / period)
-        
-        # Convert to cartesian coordinates
-        x_positions = length * np.sin(np.radians(angles))
-        y_positions = -length * np.cos(np.radians(angles))
-        
-        # Create base figure
-        fig = go.Figure()
-        
-        # Pendulum path (full arc)
-        path_angles = np.linspace(-max_angle, max_angle, 100)
-        path_x = length * np.sin(np.radians(path_angles))
-        path_y = -length * np.cos(np.radians(path_angles))
-        
+        # Memoized bob positions, keyed on the rounded invariants
+        x_positions, y_positions = _pendulum_arrays(
+            round(length, 4), round(period, 4), round(max_angle, 4))
+        
+        # Static skeleton (path, pivot, layout) is cached per
+        # length/max_angle; pickle round-trip gives a private copy
+        fig = pickle.loads(_pendulum_skeleton(length, max_angle))
+        
+        # Single animated trace: string, bob and trail merged with a
+        # None separator (one update target per frame instead of three,
+        # one picking/hover object on the client). The per-point marker
+        # sizes hide the string endpoints and shrink the trail.
+        def _pendulum_frame_arrays(i, s):
+            trail_len = i + 1 - s
+            xs = [0, x_positions[i], None] + list(x_positions[s:i + 1])
+            ys = [0, y_positions[i], None] + list(y_positions[s:i + 1])
+            sizes = [0, 20, 0] + [3] * trail_len
+            return xs, ys, sizes
+        
+        xs0, ys0, sizes0 = _pendulum_frame_arrays(0, 0)
         fig.add_trace(go.Scatter(
-            x=path_x, y=path_y,
-            mode='lines',
-            line=dict(color='lightgray', width=2, dash='dash'),
-            name='Pendulum Path',
-            showlegend=False
-        ))
-        
-        # Pivot point
-        fig.add_trace(go.Scatter(
-            x=[0], y=[0],
-            mode='markers',
-            marker=dict(size=15, color='black', symbol='x'),
-            name='Pivot Point'
+            x=xs0, y=ys0,
+            mode='lines+markers',
+            line=dict(color='brown', width=4),
+            marker=dict(size=sizes0, color='red', opacity=0.6),
+            name='Pendulum'
         ))
         
-        # Create frames for animation
-        frames = []
-        for i in range(len(t)):
-            frame = go.Frame(
-                data=[
-                    # String
-                    go.Scatter(
-                        x=[0, x_positions[i]],
-                        y=[0, y_positions[i]],
-                        mode='lines',
-                        line=dict(color='brown', width=4),
-                        name='String'
-                    ),
-                    # Bob
-                    go.Scatter(
-                        x=[x_positions[i]],
-                        y=[y_positions[i]],
-                        mode='markers',
-                        marker=dict(size=20, color='red'),
-                        name='Bob'
-                    ),
-                    # Motion trail
-                    go.Scatter(
-                        x=x_positions[max(0, i-20):i+1],
-                        y=y_positions[max(0, i-20):i+1],
-                        mode='markers',
-                        marker=dict(size=3, color='red', opacity=0.3),
-                        name='Motion Trail',
-                        showlegend=False
-                    )
-                ],
+        # Frames as raw dicts updating only the merged trace (index 2):
+        # no per-frame go.Scatter construction or schema validation
+        trail_start = np.maximum(0, np.arange(len(x_positions)) - 20)
+        fig.frames = [
+            go.Frame(
+                data=[{'x': xs, 'y': ys, 'marker': {'size': sizes}}
+                      for xs, ys, sizes in (_pendulum_frame_arrays(i, s),)],
+                traces=[2],
                 name=f'frame{i}'
             )
-            frames.append(frame)
-        
-        # Add initial frame
-        fig.add_trace(go.Scatter(
-            x=[0, x_positions[0]], y=[0, y_positions[0]],
-            mode='lines',
-            line=dict(color='brown', width=4),
-            name='String'
-        ))
-        fig.add_trace(go.Scatter(
-            x=[x_positions[0]], y=[y_positions[0]],
-            mode='markers',
-            marker=dict(size=20, color='red'),
-            name='Bob'
-        ))
-        
-        # Add frames to figure
-        fig.frames = frames
+            for i, s in enumerate(trail_start)
+        ]
         
-        # Add animation buttons
-        fig.update_layout(
-            updatemenus=[{
-                'type': 'buttons',
-                'showactive': False,
-                'buttons': [
-                    {
-                        'label': 'Play',
-                        'method': 'animate',
-                        'args': [None, {
-                            'frame': {'duration': 50, 'redraw': True},
-                            'fromcurrent': True,
-                            'mode': 'immediate'
-                        }]
-                    },
-                    {
-                        'label': 'Pause',
-                        'method': 'animate',
-                        'args': [[None], {
-                            'frame': {'duration': 0, 'redraw': False},
-                            'mode': 'immediate',
-                            'transition': {'duration': 0}
-                        }]
-                    }
-                ]
-            }],
-            title=f'Pendulum Motion: L={length}m, T={period:.2f}s',
-            xaxis_title='Position (m)',
-            yaxis_title='Height (m)',
-            xaxis=dict(range=[-length*1.2, length*1.2], scaleanchor='y'),
-            yaxis=dict(range=[-length*1.2, length*0.2]),
-            width=600,
-            height=600,
-            showlegend=True
-        )
+        # Only the title varies with the computed period
+        fig.update_layout(title=f'Pendulum Motion: L={length}m, T={period:.2f}s')
         
         return fig
     
@@ -240,14 +351,25 @@ class PhysicsVisualizer:
         
         fig = go.Figure()
         
+        # Bind the masses and velocities once instead of re-hashing the
+        # dicts in every marker size, label and arrow below
+        m1b = before_data.get('mass1', 1)
+        m2b = before_data.get('mass2', 1)
+        v1b = before_data.get('velocity1', 0)
+        v2b = before_data.get('velocity2', 0)
+        m1a = after_data.get('mass1', 1)
+        m2a = after_data.get('mass2', 1)
+        v1a = after_data.get('velocity1', 0)
+        v2a = after_data.get('velocity2', 0)
+        
         # Before collision
         fig.add_trace(go.Scatter(
             x=[0, 2], y=[1, 1],
             mode='markers+text',
-            marker=dict(size=[before_data.get('mass1', 1)*20, before_data.get('mass2', 1)*20],
+            marker=dict(size=[m1b*20, m2b*20],
                        color=['blue', 'red']),
-            text=[f"m₁={before_data.get('mass1', 1)}kg<br>v₁={before_data.get('velocity1', 0)}m/s",
-                  f"m₂={before_data.get('mass2', 1)}kg<br>v₂={before_data.get('velocity2', 0)}m/s"],
+            text=[_COLL_BEFORE_TMPL.format(i='₁', m=m1b, v=v1b),
+                  _COLL_BEFORE_TMPL.format(i='₂', m=m2b, v=v2b)],
             textposition="middle center",
             name='Before Collision'
         ))
@@ -256,40 +378,40 @@ class PhysicsVisualizer:
         fig.add_trace(go.Scatter(
             x=[0, 2], y=[0, 0],
             mode='markers+text',
-            marker=dict(size=[after_data.get('mass1', 1)*20, after_data.get('mass2', 1)*20],
+            marker=dict(size=[m1a*20, m2a*20],
                        color=['lightblue', 'pink']),
-            text=[f"m₁={after_data.get('mass1', 1)}kg<br>v₁'={after_data.get('velocity1', 0):.1f}m/s",
-                  f"m₂={after_data.get('mass2', 1)}kg<br>v₂'={after_data.get('velocity2', 0):.1f}m/s"],
+            text=[_COLL_AFTER_TMPL.format(i='₁', m=m1a, v=v1a),
+                  _COLL_AFTER_TMPL.format(i='₂', m=m2a, v=v2a)],
             textposition="middle center",
             name='After Collision'
         ))
         
-        # Velocity arrows
-        # Before collision arrows
-        if before_data.get('velocity1', 0) != 0:
-            fig.add_annotation(
-                x=0, y=1, ax=0.5*before_data.get('velocity1', 0), ay=1,
+        # Velocity arrows: collected and set in one layout update
+        # (add_annotation re-validates and rebuilds the tuple each call)
+        annotations = []
+        if v1b != 0:
+            annotations.append(dict(
+                x=0, y=1, ax=0.5*v1b, ay=1,
                 arrowhead=2, arrowsize=1, arrowwidth=2, arrowcolor='blue'
-            )
-        if before_data.get('velocity2', 0) != 0:
-            fig.add_annotation(
-                x=2, y=1, ax=2+0.5*before_data.get('velocity2', 0), ay=1,
+            ))
+        if v2b != 0:
+            annotations.append(dict(
+                x=2, y=1, ax=2+0.5*v2b, ay=1,
                 arrowhead=2, arrowsize=1, arrowwidth=2, arrowcolor='red'
-            )
-        
-        # After collision arrows
-        if after_data.get('velocity1', 0) != 0:
-            fig.add_annotation(
-                x=0, y=0, ax=0.5*after_data.get('velocity1', 0), ay=0,
+            ))
+        if v1a != 0:
+            annotations.append(dict(
+                x=0, y=0, ax=0.5*v1a, ay=0,
                 arrowhead=2, arrowsize=1, arrowwidth=2, arrowcolor='lightblue'
-            )
-        if after_data.get('velocity2', 0) != 0:
-            fig.add_annotation(
-                x=2, y=0, ax=2+0.5*after_data.get('velocity2', 0), ay=0,
+            ))
+        if v2a != 0:
+            annotations.append(dict(
+                x=2, y=0, ax=2+0.5*v2a, ay=0,
                 arrowhead=2, arrowsize=1, arrowwidth=2, arrowcolor='pink'
-            )
+            ))
         
         fig.update_layout(
+            annotations=annotations,
             title='Collision Analysis',
             xaxis_title='Position',
             yaxis_title='Time',
@@ -306,6 +428,13 @@ class PhysicsVisualizer:
         
         fig = go.Figure()
         
+        # One pass to group forces by object: the per-object list
+        # comprehension rescanned all forces for every object (O(N*M))
+        buckets = defaultdict(list)
+        for force in forces:
+            buckets[force.get('object')].append(force)
+        
+        annotations = []
         for i, obj in enumerate(objects):
             # Draw object
             fig.add_trace(go.Scatter(
@@ -318,19 +447,19 @@ class PhysicsVisualizer:
             ))
             
             # Draw forces on this object
-            obj_forces = [f for f in forces if f.get('object') == i]
-            for force in obj_forces:
+            for force in buckets.get(i, ()):
                 # Force arrow
-                fig.add_annotation(
+                annotations.append(dict(
                     x=obj.get('x', 0), y=obj.get('y', 0),
                     ax=obj.get('x', 0) + force.get('fx', 0) * 0.1,
                     ay=obj.get('y', 0) + force.get('fy', 0) * 0.1,
                     arrowhead=2, arrowsize=1, arrowwidth=3,
                     arrowcolor=force.get('color', 'black'),
                     text=f"{force.get('name', 'Force')}<br>{force.get('magnitude', 0):.1f}N"
-                )
+                ))
         
         fig.update_layout(
+            annotations=annotations,
             title='Free Body Diagram',
             xaxis_title='Position (m)',
             yaxis_title='Position (m)',
@@ -349,24 +478,27 @@ class PhysicsVisualizer:
         
         # Kinetic energy
         if 'kinetic' in energy_data:
-            fig.add_trace(go.Scatter(
-                x=time_data, y=energy_data['kinetic'],
+            ts, ys = _lttb(time_data, energy_data['kinetic'])
+            fig.add_trace(go.Scattergl(
+                x=ts, y=ys,
                 mode='lines', name='Kinetic Energy',
                 line=dict(color='red', width=3)
             ))
         
         # Potential energy
         if 'potential' in energy_data:
-            fig.add_trace(go.Scatter(
-                x=time_data, y=energy_data['potential'],
+            ts, ys = _lttb(time_data, energy_data['potential'])
+            fig.add_trace(go.Scattergl(
+                x=ts, y=ys,
                 mode='lines', name='Potential Energy',
                 line=dict(color='blue', width=3)
             ))
         
         # Total energy
         if 'total' in energy_data:
-            fig.add_trace(go.Scatter(
-                x=time_data, y=energy_data['total'],
+            ts, ys = _lttb(time_data, energy_data['total'])
+            fig.add_trace(go.Scattergl(
+                x=ts, y=ys,
                 mode='lines', name='Total Energy',
                 line=dict(color='green', width=3, dash='dash')
             ))
@@ -391,24 +523,27 @@ class PhysicsVisualizer:
         fig = go.Figure()
         
         # Position
-        fig.add_trace(go.Scatter(
-            x=time_data, y=position_data,
+        ts, ys = _lttb(time_data, position_data)
+        fig.add_trace(go.Scattergl(
+            x=ts, y=ys,
             mode='lines', name='Position',
             line=dict(color='blue', width=2),
             yaxis='y'
         ))
         
         # Velocity
-        fig.add_trace(go.Scatter(
-            x=time_data, y=velocity_data,
+        ts, ys = _lttb(time_data, velocity_data)
+        fig.add_trace(go.Scattergl(
+            x=ts, y=ys,
             mode='lines', name='Velocity',
             line=dict(color='red', width=2),
             yaxis='y2'
         ))
         
         # Acceleration
-        fig.add_trace(go.Scatter(
-            x=time_data, y=acceleration_data,
+        ts, ys = _lttb(time_data, acceleration_data)
+        fig.add_trace(go.Scattergl(
+            x=ts, y=ys,
             mode='lines', name='Acceleration',
             line=dict(color='green', width=2),
             yaxis='y3'